@@ -1,6 +1,20 @@
 import random
 import time
-import math
+import heapq
+import inspect
+import functools
+from array import array
+from collections import deque, OrderedDict
+from itertools import islice
+
+import amostragem
+import curvas
+import politicas
+import prefetch
+from estruturas import (IndiceContadores, ConjuntoIndexado, coluna_de_zeros, tipo_para_bits, BitsEmLote,
+                        InteirosEmLote, FracoesEmLote)
+from instrumentacao import Instrumentacao
+from traco import Traco, cache_de_tracos
 
 
 class AlocadorDePaginas:
@@ -12,6 +26,9 @@ class AlocadorDePaginas:
                  num_acessos: int = 100_000,
                  tempo_memoria: int = 100,
                  tempo_tratamento: int = 8e6,
+                 semente: int = 556677,
+                 bits_envelhecimento: int = 4,
+                 instrumentacao: Instrumentacao | None = None,
                  ) -> None:
         # Quadros disponíveis na memória física
         self.__num_quadros = num_quadros
@@ -28,6 +45,18 @@ class AlocadorDePaginas:
         # Tempo de tratamento de falhas (ns)
         self.__tempo_tratamento = tempo_tratamento
 
+        # Semente dos sorteios feitos pelos algoritmos (cada execução cria seu próprio gerador)
+        self.__semente = semente
+
+        # Número de bits do contador do algoritmo de envelhecimento
+        self.bits_envelhecimento = bits_envelhecimento
+
+        # Medições extras (memória, contadores de operações, perfil); None mede apenas o tempo
+        self.__instrumentacao = instrumentacao
+
+        # Medição detalhada da última execução de um algoritmo
+        self.ultima_medicao = None
+
 
     # GETTERS/SETTERS
     @property
@@ -70,19 +99,53 @@ class AlocadorDePaginas:
     def tempo_tratamento(self, tempo_tratamento: int) -> None:
         self.__tempo_tratamento = tempo_tratamento
 
+    @property
+    def semente(self) -> int:
+        return self.__semente
+
+    @semente.setter
+    def semente(self, semente: int) -> None:
+        self.__semente = semente
+
+    @property
+    def bits_envelhecimento(self) -> int:
+        return self.__bits_envelhecimento
+
+    @bits_envelhecimento.setter
+    def bits_envelhecimento(self, bits_envelhecimento: int) -> None:
+        tipo_para_bits(bits_envelhecimento)  # Valida a largura
+        self.__bits_envelhecimento = bits_envelhecimento
+
+    @property
+    def instrumentacao(self) -> Instrumentacao | None:
+        return self.__instrumentacao
+
+    @instrumentacao.setter
+    def instrumentacao(self, instrumentacao: Instrumentacao | None) -> None:
+        self.__instrumentacao = instrumentacao
+
 
     # DECORADORES
     def medir_tempo(algoritmo):
         """Mede o tempo de execução da função passada como argumento, além do próprio resultado da função executada.
-        Utilizada como decorador @medir_tempo, devendo ser utilizado na definição de cada função desejada."""
-        def wrapper(*args, **kwargs):
-            # Tempos em segundos
-            inicio = time.time()
-            metricas = algoritmo(*args, **kwargs)  # Função a ser executada
-            final = time.time()
+        Utilizada como decorador @medir_tempo, devendo ser utilizado na definição de cada função desejada.
+        Com instrumentação configurada, também mede pico de memória e/ou gera perfil, guardando tudo em ultima_medicao.
+        A função original (sem medição) fica em __wrapped__."""
+        @functools.wraps(algoritmo)
+        def wrapper(self, *args, **kwargs):
+            instrumentacao = self.__instrumentacao
+            if instrumentacao is None:
+                # Tempos em ns
+                inicio = time.perf_counter_ns()
+                metricas = algoritmo(self, *args, **kwargs)  # Função a ser executada
+                final = time.perf_counter_ns()
+                self.ultima_medicao = {"algoritmo": algoritmo.__name__, "tempo_ns": final - inicio,
+                                       "memoria_pico": None, "perfil": None}
+            else:
+                metricas, self.ultima_medicao = instrumentacao.medir(algoritmo.__name__, algoritmo, self, *args, **kwargs)
 
             # Converte para ms com 3 casas decimais
-            tempo_execucao_ms = round(((final - inicio) * 1000), 3)
+            tempo_execucao_ms = round(self.ultima_medicao["tempo_ns"] / 1e6, 3)
             return metricas, tempo_execucao_ms
         return wrapper
 
@@ -90,130 +153,170 @@ class AlocadorDePaginas:
     # ALGORITMOS DE SUBSTITUIÇÃO
     @medir_tempo
     def fifo(self, sequencia) -> dict:
-        """Algoritmo de fila simples, onde a página referenciada mais antiga é removida para entrar uma nova."""
-        fila = []
+        """Algoritmo de fila simples, onde a página referenciada mais antiga é removida para entrar uma nova.
+        A fila é indexada por um conjunto de páginas carregadas, tornando acertos e falhas O(1)."""
+        fila = deque()
+        carregadas = set()  # Índice das páginas presentes na fila
         contador_falhas = 0
+        acessos = 0  # Referências processadas
 
         # Percorre a sequência de páginas referenciadas
-        for pag_nova in sequencia():
+        for acessos, pag_nova in enumerate(sequencia(), 1):
             # Se página não está na fila
-            if pag_nova not in fila:
+            if pag_nova not in carregadas:
                 contador_falhas += 1
-                # Se ainda há espaço, adicionar nova ao final
-                if len(fila) < self.__num_quadros:
-                    fila.append(pag_nova)
-                # Se não houver espaço, remover primeiro e adicionar nova ao final
-                else:
-                    fila.pop(0)
-                    fila.append(pag_nova)
+                # Se não houver espaço, remover primeiro
+                if len(fila) >= self.__num_quadros:
+                    carregadas.discard(fila.popleft())
+                # Adicionar nova ao final
+                fila.append(pag_nova)
+                carregadas.add(pag_nova)
 
-        return self.__calcular_metricas(contador_falhas)
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - len(fila))
 
     @medir_tempo
     def segunda_chance(self, sequencia) -> dict:
         """Algoritmo de fila com segunda chance. 
         Utiliza um bit de referência para controlar se a página foi acessada no último ciclo.
-        Caso a página tenha sido acessada no último ciclo, ela volta ao final da fila ao invés de ser excluída."""
-        fila = []  # Cada elemento é uma lista [página, bit_R]
+        Caso a página tenha sido acessada no último ciclo, ela volta ao final da fila ao invés de ser excluída.
+        Um índice página -> quadro torna os acertos O(1); a fila guarda apenas os números dos quadros."""
+        paginas = []  # Página carregada em cada quadro
+        bits_R = bytearray(self.__num_quadros)  # Bit de referência de cada quadro
+        indice = {}  # Quadro ocupado por cada página carregada
+        fila = deque()  # Ordem de chegada dos quadros
         contador_falhas = 0
+        acessos = 0  # Referências processadas
+        passos_ponteiro = 0  # Quadros examinados na busca por vítimas
 
         # Percorre a sequência de páginas referenciadas
-        for pag_nova in sequencia():
+        for acessos, pag_nova in enumerate(sequencia(), 1):
             # Verifica se a página já está na fila
-            pag_encontrada = False
-            for i, [pag_atual, _] in enumerate(fila):
-                if pag_atual == pag_nova:
-                    # Atualiza página atual com o bit_R = 1
-                    fila[i][1] = 1
-                    pag_encontrada = True
-                    break
-
-            if not pag_encontrada:
-                contador_falhas += 1
-                # Se ainda há espaço, adiciona a página com o bit_R = 1
-                if len(fila) < self.__num_quadros:
-                    fila.append([pag_nova, 1])
-                else:
-                    # Percorre fila até substituir alguma página
-                    while True:
-                        # Verifica o bit_R do primeiro elemento
-                        pag_atual, bit_R = fila.pop(0)
-                        if bit_R:
-                            # Se o bit_R == 1, modifica o bit para 0 e coloca no final
-                            fila.append([pag_atual, 0])
-                        else:
-                            # Se o bit_R == 0, coloca página nova no final e encerra
-                            fila.append([pag_nova, 1])
-                            break
-
-        return self.__calcular_metricas(contador_falhas)
+            quadro = indice.get(pag_nova)
+            if quadro is not None:
+                # Atualiza página atual com o bit_R = 1
+                bits_R[quadro] = 1
+                continue
+
+            contador_falhas += 1
+            # Se ainda há espaço, adiciona a página com o bit_R = 1
+            if len(paginas) < self.__num_quadros:
+                quadro = len(paginas)
+                paginas.append(pag_nova)
+            else:
+                # Percorre fila até substituir alguma página
+                while True:
+                    # Verifica o bit_R do primeiro elemento
+                    quadro = fila.popleft()
+                    passos_ponteiro += 1
+                    if bits_R[quadro]:
+                        # Se o bit_R == 1, modifica o bit para 0 e coloca no final
+                        bits_R[quadro] = 0
+                        fila.append(quadro)
+                    else:
+                        # Se o bit_R == 0, libera o quadro para a página nova
+                        del indice[paginas[quadro]]
+                        paginas[quadro] = pag_nova
+                        break
+
+            # Coloca página nova no final com bit_R = 1
+            indice[pag_nova] = quadro
+            bits_R[quadro] = 1
+            fila.append(quadro)
+
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - len(paginas), passos_ponteiro=passos_ponteiro)
 
     @medir_tempo
     def relogio(self, sequencia) -> dict:
         """Algoritmo de segunda chance, implementado com uma fila circular (ou 'relógio') para melhorar desempenho. 
         Utiliza um bit de referência para controlar se a página foi acessada no último ciclo.
-        Caso a página tenha sido acessada no último ciclo, ela volta ao final da fila ao invés de ser excluída."""
-        relogio = []  # Cada elemento é uma lista [página, bit_R]
-        ponteiro = 0  # Ponteiro que se move circularmente pela relogio
+        Caso a página tenha sido acessada no último ciclo, ela volta ao final da fila ao invés de ser excluída.
+        Um índice página -> quadro torna os acertos O(1); falhas pagam apenas o giro do ponteiro."""
+        relogio = []  # Página carregada em cada quadro
+        bits_R = bytearray(self.__num_quadros)  # Bit de referência de cada quadro
+        indice = {}  # Quadro ocupado por cada página carregada
+        ponteiro = 0  # Ponteiro que se move circularmente pelo relogio
         contador_falhas = 0
+        acessos = 0  # Referências processadas
+        passos_ponteiro = 0  # Quadros examinados na busca por vítimas
 
         # Percorre a sequência de páginas referenciadas
-        for pag_nova in sequencia():
-            # Verifica se a página já está na relogio
-            pag_encontrada = False
-            for i, [pag_atual, _] in enumerate(relogio):
-                if pag_atual == pag_nova:
-                    # Atualiza página atual com o bit_R = 1
-                    relogio[i][1] = 1
-                    pag_encontrada = True
-                    break
+        for acessos, pag_nova in enumerate(sequencia(), 1):
+            # Verifica se a página já está no relogio
+            quadro = indice.get(pag_nova)
+            if quadro is not None:
+                # Atualiza página atual com o bit_R = 1
+                bits_R[quadro] = 1
+                continue
 
             # Se a página não está no relogio, é uma falha de página
-            if not pag_encontrada:
-                contador_falhas += 1
-                # Se ainda há espaço, adiciona a página com o bit_R = 1
-                if len(relogio) < self.__num_quadros:
-                    relogio.append([pag_nova, 1])
-                else:
-                    # Percorre relógio circularmente até substituir alguma página
-                    while True:
-                        pag_atual, bit_R = relogio[ponteiro]
-                        if bit_R:
-                            # Atualiza página apontada com bit_R = 0 e avança o ponteiro
-                            relogio[ponteiro][1] = 0
-                            ponteiro = (ponteiro + 1) % self.__num_quadros
-                        else:
-                            # Substitui por nova página com bit_R = 1 e avança ponteiro
-                            relogio[ponteiro] = [pag_nova, 1]
-                            ponteiro = (ponteiro + 1) % self.__num_quadros
-                            break
-
-        return self.__calcular_metricas(contador_falhas)
+            contador_falhas += 1
+            # Se ainda há espaço, adiciona a página com o bit_R = 1
+            if len(relogio) < self.__num_quadros:
+                indice[pag_nova] = len(relogio)
+                bits_R[len(relogio)] = 1
+                relogio.append(pag_nova)
+            else:
+                # Percorre relógio circularmente até encontrar bit_R = 0, zerando os bits pelo caminho
+                while bits_R[ponteiro]:
+                    bits_R[ponteiro] = 0
+                    ponteiro = (ponteiro + 1) % self.__num_quadros
+                    passos_ponteiro += 1
+                passos_ponteiro += 1
+
+                # Substitui por nova página com bit_R = 1 e avança ponteiro
+                del indice[relogio[ponteiro]]
+                relogio[ponteiro] = pag_nova
+                indice[pag_nova] = ponteiro
+                bits_R[ponteiro] = 1
+                ponteiro = (ponteiro + 1) % self.__num_quadros
+
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - len(relogio), passos_ponteiro=passos_ponteiro)
 
     @medir_tempo
     def nru(self, sequencia) -> dict:
         """Algoritmo 'não usado recentemente', que prioriza remover páginas não referenciadas, mesmo que modificadas. 
         Define 4 classes com base em 2 bits: referenciado (R) e modificado (M), e remove aqueles de menor classe. 
-        Bit Presente/Ausente é usado para verificar se está na memória."""
-        # Inicializa a tabela com uma linha para cada página do processo
-        # O índice da linha equivale ao número da página
-        # Cada linha contém uma lista de bits [bit_PA, bit_R, bit_M]
-        tabela = [[0, 0, 0] for _ in range(self.__max_pag_novas)]
+        Bit Presente/Ausente é usado para verificar se está na memória.
+        As classes são mantidas incrementalmente a cada referência, remoção e "reset", sem percorrer a tabela."""
+        # Inicializa a tabela com uma coluna (bytearray) para cada bit, com uma posição para cada página do processo
+        # O índice na coluna equivale ao número da página
+        bits_PA = bytearray(self.__max_pag_novas)
+        bits_R = bytearray(self.__max_pag_novas)
+        bits_M = bytearray(self.__max_pag_novas)
+        # Páginas carregadas em cada classe (bit_R * 2 + bit_M)
+        classes = [ConjuntoIndexado() for _ in range(4)]
         quadros_disponiveis = self.__num_quadros
         contador_falhas = 0
+        acessos = 0  # Referências processadas
+        interrupcoes = 0
+        linhas_percorridas = 0  # Linhas da tabela atualizadas nos "resets"
+
+        # Geradores próprios desta execução, tornando o resultado independente de outras execuções
+        # Os bits_M, os intervalos entre "resets" e as vítimas são sorteados em blocos, em fluxos separados
+        sortear_fracao = FracoesEmLote(f"{self.__semente}:vitimas").proximo
+        sortear_bit_M = BitsEmLote(f"{self.__semente}:bits_M").proximo
 
         # Simula interrupção de clock com base no numero de quadros (número de acessos para atualizar contadores)
         faixa_aleatoria = [5, 25]  # ou [25, 250]
-        contador_reset = random.randint(*faixa_aleatoria)
+        sortear_intervalo = InteirosEmLote(f"{self.__semente}:interrupcoes", *faixa_aleatoria).proximo
+        contador_reset = sortear_intervalo()
 
         # Percorre a sequência de páginas referenciadas
-        for pag_nova in sequencia():
+        for acessos, pag_nova in enumerate(sequencia(), 1):
 
             # Se página referenciada está carregada na memória (bit_PA = 1)
-            if tabela[pag_nova][0]:
-                # Atualiza página com bit_R = 1 e bit_M = 0 ou 1 (aleatório)
-                tabela[pag_nova][1] = 1
-                tabela[pag_nova][2] = random.randint(0, 1)
+            if bits_PA[pag_nova]:
+                # Atualiza página com bit_R = 1 e bit_M = 0 ou 1 (aleatório), movendo-a de classe se necessário
+                classe_anterior = bits_R[pag_nova] * 2 + bits_M[pag_nova]
+                bits_R[pag_nova] = 1
+                bits_M[pag_nova] = sortear_bit_M()
+                classe_nova = 2 + bits_M[pag_nova]
+                if classe_nova != classe_anterior:
+                    classes[classe_anterior].remover(pag_nova)
+                    classes[classe_nova].adicionar(pag_nova)
 
             # Caso página não esteja carregada na memória
             else:
@@ -222,93 +325,111 @@ class AlocadorDePaginas:
                 # Se ainda há espaço, adiciona a página com bit_PA, bit_R e bit_M = 0 ou 1 (aleatório)
                 if quadros_disponiveis > 0:
                     quadros_disponiveis -= 1
-                    tabela[pag_nova] = [1, 1, 0]
+                    bits_M[pag_nova] = 0
                 else:
-                    # Categoriza as páginas em classes
-                    classes = {0: [], 1: [], 2: [], 3: []}
-
-                    # Percorre tabela de páginas pelo índice
-                    for pag in range(len(tabela)):
-                        # Verifica se a página está carregada na memória
-                        if tabela[pag][0]:
-                            # Determina classe com base nos bits R e M e adiciona na classe adequada
-                            classe_pag = tabela[pag][1] * 2 + tabela[pag][2]
-                            classes[classe_pag].append(pag)
-
-                    # Encontra a classe mais baixa não vazia
-                    for classe in range(4):
-                        if classes[classe]:
-                            pag_a_remover = random.choice(classes[classe])
+                    # Encontra a classe mais baixa não vazia e sorteia uma página dela
+                    for classe in classes:
+                        if classe:
+                            pag_a_remover = classe.sortear(sortear_fracao)
+                            classe.remover(pag_a_remover)
                             break
 
                     # Zera todos os bits da página removida e incrementa quadros disponíves
-                    tabela[pag_a_remover] = [0, 0, 0]
+                    bits_PA[pag_a_remover] = bits_R[pag_a_remover] = bits_M[pag_a_remover] = 0
                     quadros_disponiveis += 1
 
-                    # Carrega nova página na memória com bit_PA e bit_R = 1, e bit_M = 0 ou 1, e decrementa quadros disponíveis
-                    tabela[pag_nova] = [1, 1, random.randint(0, 1)]
+                    # Carrega nova página na memória com bit_M = 0 ou 1, e decrementa quadros disponíveis
+                    bits_M[pag_nova] = sortear_bit_M()
                     quadros_disponiveis -= 1
 
+                # Marca página nova com bit_PA e bit_R = 1
+                bits_PA[pag_nova] = bits_R[pag_nova] = 1
+                classes[2 + bits_M[pag_nova]].adicionar(pag_nova)
+
             # Simula "reset" a cada n ciclos (aleatório)
             contador_reset -= 1
             if contador_reset == 0:
-                # Atualiza todos bit_R para 0
-                for linha in tabela:
-                    linha[1] = 0
+                # Atualiza bit_R para 0 nas páginas referenciadas (classes 2 e 3 passam a 0 e 1)
+                # Páginas fora da memória já têm todos os bits zerados
+                for classe_R, classe_sem_R in ((classes[2], classes[0]), (classes[3], classes[1])):
+                    paginas_R = classe_R.esvaziar()
+                    linhas_percorridas += len(paginas_R)
+                    for pag in paginas_R:
+                        bits_R[pag] = 0
+                    classe_sem_R.adicionar_varias(paginas_R)
+                interrupcoes += 1
                 # Reinicia contador de reset com outro valor aleatório
-                contador_reset = random.randint(*faixa_aleatoria)
+                contador_reset = sortear_intervalo()
 
-        return self.__calcular_metricas(contador_falhas)
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - (self.__num_quadros - quadros_disponiveis),
+                                        interrupcoes=interrupcoes, linhas_percorridas=linhas_percorridas)
 
     @medir_tempo
     def lru_lista(self, sequencia) -> dict:
         """Algoritmo 'menos usado recentemente' com lista ordenada das páginas carregadas em memória. 
         Páginas utilizadas mais recentemente ficam no final da lista ('invertida' para melhorar desempenho).
-        Quando ocorre um page fault, remove sempre a última página da lista."""
-        # Lista de páginas carregadas: índices iniciais são os usados menos recentemente
-        paginas_carregadas = []
+        Quando ocorre um page fault, remove sempre a primeira página da lista.
+        A lista é um mapa hash ordenado, tornando acertos e falhas O(1)."""
+        # Páginas carregadas: chaves iniciais são as usadas menos recentemente
+        paginas_carregadas = OrderedDict()
         contador_falhas = 0
+        acessos = 0  # Referências processadas
 
         # Percorre a sequência de páginas referenciadas
-        for pagina in sequencia():
+        for acessos, pagina in enumerate(sequencia(), 1):
+            # Se página for encontrada, move-a para o final da lista
+            if pagina in paginas_carregadas:
+                paginas_carregadas.move_to_end(pagina)
             # Se a página não estiver na lista
-            if pagina not in paginas_carregadas:
+            else:
                 contador_falhas += 1
                 # Se a lista de páginas estiver cheia, remove primeira pagina
                 if len(paginas_carregadas) >= self.__num_quadros:
-                    paginas_carregadas.pop(0)
+                    paginas_carregadas.popitem(last=False)
                 # Insere página no final da lista
-                paginas_carregadas.append(pagina)
-            # Se página for encontrada, move-a para o final da lista
-            else:
-                paginas_carregadas.remove(pagina)
-                paginas_carregadas.append(pagina)
+                paginas_carregadas[pagina] = None
 
-        return self.__calcular_metricas(contador_falhas)
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - len(paginas_carregadas))
 
     @medir_tempo
     def nfu_contador(self, sequencia) -> dict:
         """Algoritmo 'não usado frequentemente', que prioriza remover páginas menos referenciadas. 
         Mantém um contador de acessos para cada página, incrementando-o com o valor do bit de referência a cada interrupção de clock.
         A interrupção de clock é simulada como um pequeno número aleatório de referências de página (sequência de acessos). 
-        Em caso de falha de página, remove aleatoriamente uma página entre as de menor contador."""
-        # Inicializa a tabela com uma linha para cada página do processo
-        # O índice da linha equivale ao número da página
-        # Cada linha contém uma lista de bits [bit_PA, bit_R, contador]
-        tabela = [[0, 0, 0] for _ in range(self.__max_pag_novas)]
+        Em caso de falha de página, remove aleatoriamente uma página entre as de menor contador.
+        A interrupção de clock visita apenas as páginas referenciadas desde a anterior, não a tabela inteira."""
+        # Inicializa a tabela com uma coluna para cada campo (bit_PA, bit_R, contador), com uma posição para cada página
+        # O índice na coluna equivale ao número da página
+        bits_PA = bytearray(self.__max_pag_novas)
+        bits_R = bytearray(self.__max_pag_novas)
+        contadores = coluna_de_zeros("Q", self.__max_pag_novas)
+        indice = IndiceContadores()  # Páginas carregadas agrupadas por contador
+        referenciadas = set()  # Páginas com bit_R = 1 (sempre carregadas)
+        interrupcoes = 0
+        linhas_percorridas = 0  # Linhas da tabela atualizadas nas interrupções de clock
         quadros_disponiveis = self.__num_quadros
         contador_falhas = 0
+        acessos = 0  # Referências processadas
+
+        # Gerador próprio desta execução, tornando o resultado independente de outras execuções
+        # As vítimas são sorteadas com frações geradas em blocos
+        sortear_fracao = FracoesEmLote(f"{self.__semente}:vitimas").proximo
 
         # Simula interrupção de clock com base no numero de quadros (número de acessos para atualizar contadores)
         faixa_aleatoria = [5, 25]
-        contador_clock = random.randint(*faixa_aleatoria)
+        sortear_intervalo = InteirosEmLote(f"{self.__semente}:interrupcoes", *faixa_aleatoria).proximo
+        contador_clock = sortear_intervalo()
 
         # Percorre a sequência de páginas referenciadas
-        for pag_nova in sequencia():
+        for acessos, pag_nova in enumerate(sequencia(), 1):
 
             # Se página referenciada está carregada na memória (bit_PA = 1)
-            if tabela[pag_nova][0]:
-                tabela[pag_nova][1] = 1  # bit_R = 1
+            if bits_PA[pag_nova]:
+                if not bits_R[pag_nova]:
+                    bits_R[pag_nova] = 1
+                    referenciadas.add(pag_nova)
 
             # Caso página não esteja carregada na memória
             else:
@@ -317,41 +438,36 @@ class AlocadorDePaginas:
                 # Se ainda há espaço, adiciona a página com bit_PA = 1 e bit_R = 0 (mantém contador)
                 if quadros_disponiveis > 0:
                     quadros_disponiveis -= 1
-                    tabela[pag_nova][0] = 1
-                    tabela[pag_nova][1] = 0
                 else:
-                    # Encontra menor valor de contador para as paginas carregadas em memória
-                    min_contador = math.inf
-                    for linha in tabela:
-                        if linha[0] == 1 and linha[2] < min_contador:
-                            min_contador = linha[2]
-
-                    # Percorre a tabela pelos índices (páginas) e separa aqueles de menor contador
-                    menores_contadores = [pag for pag in range(len(tabela))
-                                          if tabela[pag][0] == 1 and tabela[pag][2] == min_contador]
-
-                    # Exclui aleatoriamente uma página entre os de menor contador (mantém contador)
-                    pag_a_remover = random.choice(menores_contadores)
-                    tabela[pag_a_remover][0] = 0
-                    tabela[pag_a_remover][1] = 0
-                    quadros_disponiveis += 1
+                    # Exclui aleatoriamente uma página entre as de menor contador carregadas em memória (mantém contador)
+                    pag_a_remover = indice.escolher_menor(sortear_fracao)
+                    indice.remover(pag_a_remover, contadores[pag_a_remover])
+                    referenciadas.discard(pag_a_remover)
+                    bits_PA[pag_a_remover] = bits_R[pag_a_remover] = 0
 
-                    # Carrega nova página na memória com bit_PA = 1 e bit_R = 0 (mantém contador)
-                    quadros_disponiveis -= 1
-                    tabela[pag_nova][0] = 1
-                    tabela[pag_nova][1] = 0
+                # Carrega nova página na memória com bit_PA = 1 e bit_R = 0 (mantém contador)
+                bits_PA[pag_nova] = 1
+                indice.adicionar(pag_nova, contadores[pag_nova])
 
             # Simula interrupção de clock a cada n ciclos (aleatório)
             contador_clock -= 1
             if contador_clock == 0:
                 # Incrementa contador com bit_R e atualiza bit_R para 0
-                for linha in tabela:
-                    linha[2] += linha[1]
-                    linha[1] = 0
+                # Demais páginas têm bit_R = 0 e não mudam
+                interrupcoes += 1
+                linhas_percorridas += len(referenciadas)
+                movimentos = [(pag, contadores[pag], contadores[pag] + 1) for pag in referenciadas]
+                indice.mover_varios(movimentos)
+                for pag in referenciadas:
+                    contadores[pag] += 1
+                    bits_R[pag] = 0
+                referenciadas.clear()
                 # Reinicia contador de clock com outro valor aleatório
-                contador_clock = random.randint(*faixa_aleatoria)
+                contador_clock = sortear_intervalo()
 
-        return self.__calcular_metricas(contador_falhas)
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - (self.__num_quadros - quadros_disponiveis),
+                                        interrupcoes=interrupcoes, linhas_percorridas=linhas_percorridas)
 
     @medir_tempo
     def envelhecimento(self, sequencia):
@@ -359,24 +475,43 @@ class AlocadorDePaginas:
         Mantém um contador de acessos para cada página, incrementando-o a cada interrupção de clock (com o valor do bit_R).
         Diminui contadores ao longo do tempo para dar chanca de "renovar" as páginas a serem substituidas. 
         A interrupção de clock e simulada como um pequeno número aleatório de referências de página (sequência de acessos). 
-        Em caso de falha de página, remove aleatoriamente uma página entre as de menor contador."""
-        # Inicializa a tabela com uma linha para cada página do processo
-        # O índice da linha equivale ao número da página
-        # Cada linha contém uma lista de bits [bit_PA, bit_R, contador(binario)]
-        tabela = [[0, 0, 0] for _ in range(self.__max_pag_novas)]
+        Em caso de falha de página, remove aleatoriamente uma página entre as de menor contador.
+        O envelhecimento é aplicado de forma preguiçosa: cada linha guarda a época (número de interrupções) em que seu
+        contador foi gravado, e o valor atual é obtido deslocando-o pelas interrupções passadas desde então.
+        O contador tem bits_envelhecimento bits (4 por padrão)."""
+        # Inicializa a tabela com uma coluna para cada campo (bit_PA, bit_R, contador, época do contador),
+        # com uma posição para cada página. O índice na coluna equivale ao número da página
+        bits_PA = bytearray(self.__max_pag_novas)
+        bits_R = bytearray(self.__max_pag_novas)
+        contadores = coluna_de_zeros(tipo_para_bits(self.__bits_envelhecimento), self.__max_pag_novas)
+        epocas = coluna_de_zeros("Q", self.__max_pag_novas)
+        bit_mais_significativo = 1 << (self.__bits_envelhecimento - 1)
+        indice = IndiceContadores()  # Páginas carregadas agrupadas pelo contador atual
+        referenciadas = set()  # Páginas com bit_R = 1 (sempre carregadas)
+        interrupcoes = 0
+        linhas_percorridas = 0  # Linhas da tabela atualizadas nas interrupções de clock
+        epoca = 0  # Número de interrupções de clock já ocorridas
         quadros_disponiveis = self.__num_quadros
         contador_falhas = 0
+        acessos = 0  # Referências processadas
+
+        # Gerador próprio desta execução, tornando o resultado independente de outras execuções
+        # As vítimas são sorteadas com frações geradas em blocos
+        sortear_fracao = FracoesEmLote(f"{self.__semente}:vitimas").proximo
 
         # Simula interrupção de clock com base no numero de quadros (número de acessos para atualizar contadores)
         faixa_aleatoria = [5, 25]
-        contador_clock = random.randint(*faixa_aleatoria)
+        sortear_intervalo = InteirosEmLote(f"{self.__semente}:interrupcoes", *faixa_aleatoria).proximo
+        contador_clock = sortear_intervalo()
 
         # Percorre a sequência de páginas referenciadas
-        for pag_nova in sequencia():
+        for acessos, pag_nova in enumerate(sequencia(), 1):
 
             # Se página referenciada está carregada na memória (bit_PA = 1)
-            if tabela[pag_nova][0]:
-                tabela[pag_nova][1] = 1  # bit_R = 1
+            if bits_PA[pag_nova]:
+                if not bits_R[pag_nova]:
+                    bits_R[pag_nova] = 1
+                    referenciadas.add(pag_nova)
 
             # Caso página não esteja carregada na memória
             else:
@@ -385,94 +520,360 @@ class AlocadorDePaginas:
                 # Se ainda há espaço, adiciona a página com bit_PA = 1 e bit_R = 0 (mantém contador)
                 if quadros_disponiveis > 0:
                     quadros_disponiveis -= 1
-                    tabela[pag_nova][0] = 1
-                    tabela[pag_nova][1] = 0
                 else:
-                    # Encontra menor valor de contador para as paginas carregadas em memória
-                    min_contador = math.inf
-                    for linha in tabela:
-                        if linha[0] == 1 and linha[2] < min_contador:
-                            min_contador = linha[2]
-
-                    # Percorre a tabela pelos índices (páginas) e separa aqueles de menor contador
-                    menores_contadores = [pag for pag in range(len(tabela))
-                                          if tabela[pag][0] == 1 and tabela[pag][2] == min_contador]
-
-                    # Exclui aleatoriamente uma página entre os de menor contador (mantém contador)
-                    pag_a_remover = random.choice(menores_contadores)
-                    tabela[pag_a_remover][0] = 0
-                    tabela[pag_a_remover][1] = 0
-                    quadros_disponiveis += 1
+                    # Exclui aleatoriamente uma página entre as de menor contador carregadas em memória (mantém contador)
+                    pag_a_remover = indice.escolher_menor(sortear_fracao)
+                    indice.remover(pag_a_remover, contadores[pag_a_remover] >> (epoca - epocas[pag_a_remover]))
+                    referenciadas.discard(pag_a_remover)
+                    bits_PA[pag_a_remover] = bits_R[pag_a_remover] = 0
 
-                    # Carrega nova página na memória com bit_PA = 1 e bit_R = 0 (mantém contador)
-                    quadros_disponiveis -= 1
-                    tabela[pag_nova][0] = 1
-                    tabela[pag_nova][1] = 0
+                # Carrega nova página na memória com bit_PA = 1 e bit_R = 0 (mantém contador)
+                bits_PA[pag_nova] = 1
+                indice.adicionar(pag_nova, contadores[pag_nova] >> (epoca - epocas[pag_nova]))
 
             # Simula interrupção de clock a cada n ciclos (aleatório)
             contador_clock -= 1
             if contador_clock == 0:
-                # Atualiza contador deslocando bits para direita e adicionando bit_R ao mais significativo
-                for linha in tabela:
-                    linha[2] = (linha[2] >> 1) | (linha[1] << 3)
-                    linha[1] = 0
+                # Desloca os contadores de todas as páginas carregadas para direita, grupo a grupo
+                indice.remapear(lambda contador: contador >> 1)
+                # Adiciona bit_R ao mais significativo das páginas referenciadas e atualiza bit_R para 0
+                # Demais páginas apenas envelhecem, o que é calculado quando forem lidas
+                interrupcoes += 1
+                linhas_percorridas += len(referenciadas)
+                movimentos = []
+                for pag in referenciadas:
+                    deslocado = (contadores[pag] >> (epoca - epocas[pag])) >> 1
+                    movimentos.append((pag, deslocado, deslocado | bit_mais_significativo))
+                    contadores[pag] = deslocado | bit_mais_significativo
+                    epocas[pag] = epoca + 1
+                    bits_R[pag] = 0
+                indice.mover_varios(movimentos)
+                referenciadas.clear()
+                epoca += 1
                 # Reinicia contador de clock com outro valor aleatório
-                contador_clock = random.randint(*faixa_aleatoria)
+                contador_clock = sortear_intervalo()
+
+        return self.__calcular_metricas(contador_falhas, acertos=acessos - contador_falhas,
+                                        remocoes=contador_falhas - (self.__num_quadros - quadros_disponiveis),
+                                        interrupcoes=interrupcoes, linhas_percorridas=linhas_percorridas)
+
+    @medir_tempo
+    def arc(self, sequencia) -> dict:
+        """Algoritmo de substituição adaptativo (ARC). As páginas carregadas ficam em duas listas LRU: T1 (referenciadas uma
+        vez) e T2 (referenciadas mais de uma vez), e as páginas removidas de cada uma ficam como "fantasmas" (sem ocupar quadro)
+        em B1 e B2. Uma falha em B1 aumenta o tamanho alvo de T1, e uma em B2 o reduz, adaptando a divisão entre recência e
+        frequência. Uma varredura passa apenas por T1, sem expulsar as páginas de T2.
+        Executa a política incremental (politicas.Arc), cujas listas são dicionários ordenados com operações O(1)."""
+        politica = self.__criar_politica("arc", self.__num_quadros)
+        politica.acessar_lote(sequencia())
+        return self.__metricas_da_politica(politica, alvo_t1=politica.alvo_t1)
+
+    @medir_tempo
+    def dois_q(self, sequencia) -> dict:
+        """Algoritmo 2Q (versão completa). Páginas novas entram em uma fila FIFO (A1in, 1/4 dos quadros); ao sair dela,
+        ficam como "fantasmas" (sem ocupar quadro) em A1out (até 1/2 dos quadros). Só uma página referenciada de novo
+        enquanto fantasma entra na lista LRU principal (Am), de modo que varreduras não expulsam as páginas quentes.
+        Executa a política incremental (politicas.DoisQ), cujas filas são dicionários ordenados com operações O(1)."""
+        politica = self.__criar_politica("dois_q", self.__num_quadros)
+        politica.acessar_lote(sequencia())
+        return self.__metricas_da_politica(politica, promocoes=politica.promocoes)
+
+    @medir_tempo
+    def lirs(self, sequencia) -> dict:
+        """Algoritmo LIRS (Low Inter-reference Recency Set). As páginas com menor distância entre referências (LIR) ocupam
+        quase todos os quadros; as demais (HIR) disputam apenas 1% dos quadros, em uma fila FIFO, e são as únicas removidas.
+        A pilha S guarda a recência das páginas LIR e das HIR referenciadas recentemente (mesmo fora da memória):
+        uma página HIR referenciada de novo enquanto está em S passa a LIR, e a LIR mais antiga volta a HIR.
+        S guarda no máximo o dobro dos quadros em páginas HIR fora da memória, descartando as mais antigas.
+        Executa a política incremental (politicas.Lirs), cujas S e fila são dicionários ordenados com operações O(1)
+        amortizadas."""
+        politica = self.__criar_politica("lirs", self.__num_quadros)
+        politica.acessar_lote(sequencia())
+        return self.__metricas_da_politica(politica, promocoes=politica.promocoes)
+
+    @medir_tempo
+    def otimo(self, sequencia) -> dict:
+        """Algoritmo ótimo (Belady), que remove a página cujo próximo uso está mais distante no futuro.
+        Não é implementável na prática, servindo de referência para os demais algoritmos.
+        Os próximos usos são pré-calculados em uma passada de trás para frente pela sequência materializada,
+        e a vítima é escolhida por um heap de máximo com remoção preguiçosa de entradas desatualizadas."""
+        paginas = self.__materializar(sequencia)
+        proximos = curvas.proximos_usos(paginas)
+        proximo_uso = {}  # Páginas carregadas -> posição do próximo acesso
+        heap = []  # Entradas (-próximo uso, página); válidas apenas se coincidirem com proximo_uso
+        contador_falhas = 0
+
+        # Percorre a sequência de páginas referenciadas
+        for pagina, proximo in zip(paginas, proximos):
+            if pagina not in proximo_uso:
+                contador_falhas += 1
+                # Se não houver espaço, remove a página usada mais tarde no futuro
+                if len(proximo_uso) >= self.__num_quadros:
+                    while True:
+                        uso, pag_a_remover = heapq.heappop(heap)
+                        if proximo_uso.get(pag_a_remover) == -uso:
+                            del proximo_uso[pag_a_remover]
+                            break
+
+            # Atualiza o próximo uso da página referenciada
+            proximo_uso[pagina] = proximo
+            heapq.heappush(heap, (-proximo, pagina))
+
+            # Descarta entradas desatualizadas quando o heap cresce demais
+            if len(heap) > 2 * self.__num_quadros + 64:
+                heap = [(-uso, pag) for pag, uso in proximo_uso.items()]
+                heapq.heapify(heap)
+
+        return self.__calcular_metricas(contador_falhas, acertos=len(paginas) - contador_falhas,
+                                        remocoes=contador_falhas - len(proximo_uso))
 
-        return self.__calcular_metricas(contador_falhas)
+
+    # CURVAS DE FALHAS
+    @medir_tempo
+    def curva_lru(self, sequencia, max_quadros: int | None = None) -> dict:
+        """Calcula as métricas do LRU para todos os números de quadros (1 a max_quadros) em uma única passada pela sequência,
+        a partir das distâncias de pilha de Mattson. Por padrão vai até o máximo de páginas endereçáveis."""
+        paginas = self.__materializar(sequencia)
+        return self.__calcular_curva(*curvas.distancias_lru(paginas), max_quadros)
+
+    @medir_tempo
+    def curva_otimo(self, sequencia, max_quadros: int | None = None) -> dict:
+        """Calcula as métricas do algoritmo ótimo (Belady) para todos os números de quadros (1 a max_quadros) 
+        em uma única passada pela sequência. Por padrão vai até o máximo de páginas endereçáveis."""
+        paginas = self.__materializar(sequencia)
+        return self.__calcular_curva(*curvas.distancias_otimo(paginas), max_quadros)
+
+    @medir_tempo
+    def multiplas_configuracoes(self, sequencia, configuracoes, tamanho_bloco: int = 1 << 16,
+                                limiar_falhas: float = 0.1) -> dict:
+        """Simula várias configurações (algoritmo, quadros), para curvas de algoritmos sem propriedade de pilha.
+        FIFO e relógio usam simuladores de vários números de quadros em uma única passada (politicas.POLITICAS_MULTIPLAS),
+        em que um acerto em todas as configurações custa uma única consulta, mas cada falha custa mais que em uma execução
+        separada: só compensam com poucas falhas. Por isso as primeiras REFERENCIAS_DE_TESTE referências passam pelo
+        simulador múltiplo e, se a taxa média de falhas (descontadas as de carga inicial) passar de limiar_falhas, cada
+        configuração é executada pelo seu método, como os demais algoritmos.
+        Os resultados são os mesmos dos métodos equivalentes. Retorna {(algoritmo, quadros): métricas}."""
+        configuracoes = list(dict.fromkeys(configuracoes))
+        grupos = {}  # Algoritmo -> números de quadros
+        for algoritmo, quadros in configuracoes:
+            grupos.setdefault(algoritmo, []).append(quadros)
+
+        resultados = {}
+        for algoritmo, lista_quadros in grupos.items():
+            multiplo = politicas.POLITICAS_MULTIPLAS.get(algoritmo)
+            if multiplo is not None and len(lista_quadros) > 1:
+                simulador = multiplo(lista_quadros)
+                paginas = iter(sequencia())
+                teste = array("Q", islice(paginas, self.REFERENCIAS_DE_TESTE))
+                simulador.acessar_lote(teste)
+                falhas_teste = max(0, sum(simulador.falhas) - sum(lista_quadros))
+                if falhas_teste <= limiar_falhas * len(lista_quadros) * len(teste):
+                    # Lê o restante da sequência em blocos (array), sem materializá-la
+                    acessos = len(teste)
+                    while bloco := array("Q", islice(paginas, tamanho_bloco)):
+                        simulador.acessar_lote(bloco)
+                        acessos += len(bloco)
+                    for quadros, falhas, ocupados in zip(lista_quadros, simulador.falhas, simulador.ocupados):
+                        resultados[(algoritmo, quadros)] = self.__calcular_metricas(
+                            falhas, acertos=acessos - falhas, remocoes=falhas - ocupados)
+                    continue
+
+            # Uma execução do método por configuração (sem medir cada uma: a medição é da chamada inteira)
+            metodo = getattr(type(self), algoritmo).__wrapped__
+            num_quadros = self.__num_quadros
+            try:
+                for quadros in lista_quadros:
+                    self.__num_quadros = quadros
+                    resultados[(algoritmo, quadros)] = metodo(self, sequencia)
+            finally:
+                self.__num_quadros = num_quadros
+
+        return {configuracao: resultados[configuracao] for configuracao in configuracoes}
+
+    # Referências simuladas pelos simuladores múltiplos antes de decidir se compensam (multiplas_configuracoes)
+    REFERENCIAS_DE_TESTE = 4096
+
+
+    # PRÉ-BUSCA
+    @medir_tempo
+    def com_prefetch(self, sequencia, algoritmo: str, prefetcher="fixo", tempo_pagina_extra: float = 50_000,
+                     **opcoes_prefetch) -> dict:
+        """Executa o algoritmo (pela sua política incremental) com uma etapa de pré-busca: 'fixo', 'adaptativo' ou
+        'passo' (prefetch.PREFETCHERS, configurados por opcoes_prefetch), ou um pré-buscador já criado.
+        Cada falha por demanda custa tempo_tratamento, como nas demais métricas, e as páginas pré-buscadas seguem no
+        mesmo lote de leitura, acrescentando apenas tempo_pagina_extra (ns) cada uma, incluído no tempo médio de acesso.
+        Os contadores da pré-busca e o custo total dos lotes ficam em 'prefetch'."""
+        if isinstance(prefetcher, str):
+            classe = prefetch.PREFETCHERS[prefetcher]
+            # Pré-buscadores que limitam a janela pelo tamanho da memória recebem o número de quadros
+            if "num_quadros" in inspect.signature(classe).parameters:
+                opcoes_prefetch.setdefault("num_quadros", self.__num_quadros)
+            prefetcher = classe(**opcoes_prefetch)
+        politica = self.__criar_politica(algoritmo, self.__num_quadros)
+        contadores = prefetch.simular(politica, sequencia(), prefetcher, self.__max_pag_novas)
+
+        # As páginas pré-buscadas também ocupam quadros: cada carga além das que continuam na memória removeu uma página
+        metricas = self.__metricas_da_politica(politica, carregadas=politica.falhas + contadores["paginas_lidas"])
+        custo_lotes = contadores["paginas_lidas"] * tempo_pagina_extra / self.__num_acessos / 1e6
+        metricas["acesso"] = round(self.__tempo_medio_acesso(politica.falhas / self.__num_acessos) + custo_lotes, 3)
+        metricas["prefetch"] = {**contadores, "custo_lotes": round(custo_lotes, 3)}
+        return metricas
+
+
+    # SIMULAÇÃO APROXIMADA
+    @medir_tempo
+    def estimar_por_amostragem(self, sequencia, algoritmo: str, taxa: float = 0.01, semente_amostra: int = 0,
+                               z: float = 1.96) -> dict:
+        """Estima as métricas de um algoritmo simulando apenas as páginas amostradas por hash (SHARDS), com o número
+        de quadros reduzido na mesma proporção. Vale para algoritmos sem interrupções de clock (FIFO, segunda chance,
+        relógio e LRU), cujo comportamento não depende do número total de referências entre eventos.
+        Além das métricas estimadas, retorna em 'amostragem' os limites do intervalo de confiança (z erros padrão,
+        95% por padrão) da porcentagem de falhas e do tempo médio de acesso."""
+        if algoritmo not in ("fifo", "segunda_chance", "relogio", "lru_lista"):
+            raise ValueError(f"Algoritmo sem suporte a amostragem: {algoritmo}")
+        quadros_amostra = max(1, round(self.__num_quadros * taxa))
+        politica = politicas.POLITICAS[algoritmo](quadros_amostra)
+        # Traços em memória com menos páginas distintas possíveis que referências usam a tabela de páginas amostradas
+        max_paginas = None
+        if isinstance(sequencia, Traco) and len(sequencia) and max(sequencia.paginas) < len(sequencia):
+            max_paginas = max(sequencia.paginas) + 1
+        filtro = amostragem.FiltroDeAmostragem(taxa, semente_amostra, max_paginas)
+
+        falhas_por_pagina = {}  # Falhas de cada página amostrada, usadas no erro padrão
+        for pagina in filtro(sequencia()):
+            if politica.acessar(pagina):
+                falhas_por_pagina[pagina] = falhas_por_pagina.get(pagina, 0) + 1
+
+        taxa_falhas, erro_padrao = amostragem.estimar_taxa(falhas_por_pagina, filtro.referencias, taxa)
+        taxa_falhas = min(1.0, taxa_falhas)
+        minimo = max(0.0, taxa_falhas - z * erro_padrao)
+        maximo = min(1.0, taxa_falhas + z * erro_padrao)
+
+        # Falhas estimadas: acertos e remoções não são contados na amostra
+        metricas = self.__calcular_metricas(round(taxa_falhas * self.__num_acessos))
+        metricas["amostragem"] = {
+            "taxa": taxa,
+            "quadros": quadros_amostra,
+            "acessos": politica.acessos,
+            "erro_padrao": round(erro_padrao * 100, 4),
+            "porcentagem_min": round(minimo * 100, 4),
+            "porcentagem_max": round(maximo * 100, 4),
+            "acesso_min": round(self.__tempo_medio_acesso(minimo), 3),
+            "acesso_max": round(self.__tempo_medio_acesso(maximo), 3),
+        }
+        return metricas
 
 
     # SEQUÊNCIAS DE ACESSOS
-    def sequencia_aleatoria(self) -> int:
+    def sequencia_aleatoria(self, semente: int = 112233) -> int:
         """Gera uma sequência pseudoaleatória dentro da faixa possível de páginas referenciadas. 
         A sequência aleatória é fixada para garantir condições iguais de comparação de algoritmos."""
-        random.seed(112233)  # "Fixa" a sequência aleatória
+        aleatorio = random.Random(semente)  # "Fixa" a sequência aleatória
         
         # Gera sequência um a um ao invés de guardar tudo em memória
         for _ in range(self.__num_acessos):
-            yield random.randint(0, self.__max_pag_novas - 1)
+            yield aleatorio.randint(0, self.__max_pag_novas - 1)
 
-    def sequencia_localizada(self) -> int:
+    def sequencia_localizada(self, semente: int = 445566) -> int:
         """Gera uma sequência aleatória com maior localidade espacial. 
         A sequência avança aleatoriamente a partir de uma página inicial.
         A localidade é definida em 1/4 do total de páginas. Outros valores podem ser testados.
         A sequência aleatória é fixada para garantir condições iguais de comparação de algoritmos."""
-        random.seed(445566)  # "Fixa" a sequência aleatória
+        aleatorio = random.Random(semente)  # "Fixa" a sequência aleatória
         
-        pagina = random.randint(0, self.__max_pag_novas - 1)  # Inicia em uma página qualquer
+        pagina = aleatorio.randint(0, self.__max_pag_novas - 1)  # Inicia em uma página qualquer
         localidade = self.__max_pag_novas // 8  # Define a região de localidade
 
         # Gera sequência um a um ao invés de guardar tudo em memória
         for _ in range(0, self.__num_acessos):
-            passo = random.randint(-localidade, localidade)  # Escolhe próxima página a partir de uma faixa
+            passo = aleatorio.randint(-localidade, localidade)  # Escolhe próxima página a partir de uma faixa
             pagina += passo
             yield pagina % self.__max_pag_novas
 
-    def sequencia_linear(self) -> int:
+    def sequencia_linear(self, semente: int = 778899) -> int:
         """Gera uma sequência linear dentro da faixa possível de páginas referenciadas. 
         Inicia a sequencia a partir de uma pagina aleatória.
         A sequência aleatória é fixada para garantir condições iguais de comparação de algoritmos."""
-        random.seed(778899)  # "Fixa" a sequência aleatória
+        aleatorio = random.Random(semente)  # "Fixa" a sequência aleatória
         
-        pag_inicial = random.randint(0, self.__max_pag_novas - 1)  # Inicia em uma página qualquer
+        pag_inicial = aleatorio.randint(0, self.__max_pag_novas - 1)  # Inicia em uma página qualquer
 
         # Gera sequência um a um ao invés de guardar tudo em memória
         for i in range(self.__num_acessos):
             yield (pag_inicial + i) % self.__max_pag_novas
 
+    def traco(self, sequencia, semente: int | None = None) -> Traco:
+        """Materializa a sequência uma única vez, para ser reproduzida da memória por todos os algoritmos.
+        Traços são guardados em cache identificados por (gerador, semente, número de acessos, máximo de páginas).
+        Sem semente, usa a semente padrão do gerador."""
+        if semente is None:
+            semente = inspect.signature(sequencia).parameters["semente"].default
+        chave = (sequencia.__name__, semente, self.__num_acessos, self.__max_pag_novas)
+
+        def criar() -> Traco:
+            return Traco.materializar(sequencia.__name__, sequencia(semente), self.__max_pag_novas, semente)
+
+        return cache_de_tracos.obter(chave, criar)
+
 
     # MÉTODOS AUXILIARES
-    def __calcular_metricas(self, falhas: int) -> dict:
-        """Calcula as métricas relevantes para os algoritmos de substituição de páginas."""
+    def __calcular_metricas(self, falhas: int, acertos: int | None = None, remocoes: int | None = None,
+                            **operacoes) -> dict:
+        """Calcula as métricas relevantes para os algoritmos de substituição de páginas.
+        Com a instrumentação de operações ligada, inclui os contadores de operações do algoritmo em 'operacoes';
+        acertos e remoções só aparecem quando contados pelo algoritmo (não nas estimativas)."""
         taxa_falhas = falhas/self.__num_acessos
 
-        # Calcula tempo médio de acesso à memória e converte em ms
-        tempo_medio_acesso = ((1 - taxa_falhas) * self.__tempo_memoria +
-                              (taxa_falhas * self.__tempo_tratamento)) / 1e6
-
         metricas = {
             "total": falhas,
             "porcentagem": round(taxa_falhas*100, 4),
-            "acesso": round(tempo_medio_acesso, 3),
+            "acesso": round(self.__tempo_medio_acesso(taxa_falhas), 3),
         }
+
+        if self.__instrumentacao is not None and self.__instrumentacao.operacoes:
+            contados = {"acertos": acertos, "falhas": falhas, "remocoes": remocoes}
+            metricas["operacoes"] = {
+                **{nome: valor for nome, valor in contados.items() if valor is not None},
+                **operacoes,
+            }
         return metricas
+
+    def __metricas_da_politica(self, politica: politicas.Politica, carregadas: int | None = None, **operacoes) -> dict:
+        """Métricas de uma política incremental já executada. Todos os quadros começam livres, e as páginas só saem
+        da memória removidas: as remoções são as páginas carregadas (por padrão, uma por falha) que não estão mais nela."""
+        if carregadas is None:
+            carregadas = politica.falhas
+        return self.__calcular_metricas(politica.falhas, acertos=politica.acessos - politica.falhas,
+                                        remocoes=carregadas - len(politica), **operacoes)
+
+    def __criar_politica(self, algoritmo: str, quadros: int) -> politicas.Politica:
+        """Cria a política incremental equivalente ao método do algoritmo, com a semente e os parâmetros do alocador."""
+        classe = politicas.POLITICAS.get(algoritmo)
+        if classe is None:
+            raise ValueError(f"Algoritmo sem política incremental: {algoritmo}")
+        # Repassa apenas os parâmetros do alocador que a política aceita
+        parametros = inspect.signature(classe).parameters
+        opcoes = {nome: valor for nome, valor in (("semente", self.__semente),
+                                                  ("bits_contador", self.__bits_envelhecimento))
+                  if nome in parametros}
+        return classe(quadros, **opcoes)
+
+    def __materializar(self, sequencia):
+        """Páginas da sequência com acesso por posição: o próprio array de um traço em memória, sem cópia,
+        ou uma lista com as páginas dos demais geradores."""
+        return sequencia.paginas if isinstance(sequencia, Traco) else list(sequencia())
+
+    def __tempo_medio_acesso(self, taxa_falhas: float) -> float:
+        """Calcula tempo médio de acesso à memória para uma taxa de falhas (0 a 1) e converte em ms."""
+        return ((1 - taxa_falhas) * self.__tempo_memoria + (taxa_falhas * self.__tempo_tratamento)) / 1e6
+
+    def __calcular_curva(self, histograma: list, falhas_frias: int, max_quadros: int | None) -> dict:
+        """Converte um histograma de distâncias de pilha nas métricas de cada número de quadros."""
+        if max_quadros is None:
+            max_quadros = self.__max_pag_novas
+        falhas = curvas.falhas_por_quadros(histograma, falhas_frias, max_quadros)
+        # Cada página distinta (falha fria) é carregada uma vez e fica na memória até faltarem quadros
+        acessos = sum(histograma) + falhas_frias
+        return {quadros: self.__calcular_metricas(falhas[quadros], acertos=acessos - falhas[quadros],
+                                                  remocoes=falhas[quadros] - min(quadros, falhas_frias))
+                for quadros in range(1, max_quadros + 1)}
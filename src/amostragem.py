@@ -0,0 +1,80 @@
+import math
+from itertools import count
+from operator import itemgetter
+
+
+# AMOSTRAGEM ESPACIAL (SHARDS)
+# Em vez de simular todas as referências, escolhe-se um subconjunto das páginas por hash do número da página e
+# simulam-se apenas as referências a essas páginas, com a memória reduzida na mesma proporção (taxa * quadros).
+# Como a escolha depende só da página, cada página amostrada mantém toda a sua sequência de referências, e a
+# simulação em miniatura reproduz a taxa de falhas da simulação completa. Memória e tempo de simulação caem
+# proporcionalmente à taxa; a leitura do traço, porém, continua sendo completa.
+
+BITS_HASH = 24  # Bits do hash comparados com o limite de amostragem
+MASCARA_64 = (1 << 64) - 1
+
+
+def limite_de_amostragem(taxa: float) -> int:
+    """Converte a taxa de amostragem (0 < taxa <= 1) no limite do hash: páginas com hash abaixo dele são amostradas."""
+    if not 0 < taxa <= 1:
+        raise ValueError(f"Taxa de amostragem inválida: {taxa} (deve estar entre 0 e 1)")
+    return max(1, round(taxa * (1 << BITS_HASH)))
+
+
+class FiltroDeAmostragem:
+    """Filtra as referências às páginas amostradas, escolhidas por um hash multiplicativo de 64 bits do número da página.
+    A mesma semente escolhe sempre as mesmas páginas. Com max_paginas (páginas de 0 a max_paginas - 1), a escolha de
+    cada página é calculada uma única vez numa tabela, e o filtro roda sem laço em Python.
+    Ao fim da passada, referencias indica o total de referências lidas."""
+
+    def __init__(self, taxa: float, semente: int = 0, max_paginas: int | None = None) -> None:
+        self.taxa = taxa
+        self.semente = semente
+        self.max_paginas = max_paginas
+        self.__limite = limite_de_amostragem(taxa)
+        self.__referencias = 0
+        self.__contador = None
+
+    def amostrada(self, pagina: int) -> bool:
+        return (((pagina ^ self.semente) * 0x9E3779B97F4A7C15) & MASCARA_64) >> (64 - BITS_HASH) < self.__limite
+
+    @property
+    def referencias(self) -> int:
+        if self.__contador is not None:
+            self.__referencias = next(self.__contador)
+            self.__contador = None
+        return self.__referencias
+
+    def __call__(self, paginas):
+        if self.max_paginas is None:
+            return self.__filtrar(paginas)
+
+        tabela = bytes(map(self.amostrada, range(self.max_paginas)))
+        # zip com count conta as referências à medida que passam
+        self.__contador = count()
+        contadas = map(itemgetter(0), zip(paginas, self.__contador))
+        return filter(tabela.__getitem__, contadas)
+
+    def __filtrar(self, paginas):
+        limite = self.__limite
+        semente = self.semente
+        deslocamento = 64 - BITS_HASH
+        posicao = 0
+        for posicao, pagina in enumerate(paginas, start=1):
+            if (((pagina ^ semente) * 0x9E3779B97F4A7C15) & MASCARA_64) >> deslocamento < limite:
+                yield pagina
+        self.__referencias = posicao
+
+
+def estimar_taxa(falhas_por_pagina: dict, referencias: int, taxa: float) -> tuple[float, float]:
+    """Estima a taxa de falhas a partir das falhas de cada página amostrada, retornando (estimativa, erro padrão).
+    As falhas são divididas pelo número esperado de referências amostradas (taxa * referencias), e não pelo observado:
+    páginas muito referenciadas, que quase sempre acertam, fazem o número observado variar muito de uma amostra para
+    outra (como no ajuste do SHARDS). O erro padrão é o do estimador de total sob amostragem de Poisson das páginas;
+    não inclui o viés da simulação em miniatura, pequeno quando a amostra tem muitas páginas."""
+    if referencias == 0:
+        return 0.0, 0.0
+    esperadas = taxa * referencias
+    estimativa = sum(falhas_por_pagina.values()) / esperadas
+    variancia = (1 - taxa) * sum(falhas * falhas for falhas in falhas_por_pagina.values())
+    return estimativa, math.sqrt(variancia) / esperadas
@@ -0,0 +1,110 @@
+import argparse
+import itertools
+import json
+import math
+import statistics
+import sys
+
+from alocador_de_paginas import AlocadorDePaginas
+from executor import ALGORITMOS, nome_sequencia
+
+
+# Matriz padrão (rápida) e completa (64 a 1M quadros) de cenários de benchmark
+QUADROS_PADRAO = [64, 1024, 16384]
+QUADROS_COMPLETO = [64, 1024, 16384, 262144, 1048576]
+RAZOES_PADRAO = [1.5, 2.0]
+SEQUENCIAS_PADRAO = ["sequencia_aleatoria", "sequencia_localizada", "sequencia_linear"]
+
+
+def percentil(valores: list, p: float) -> float:
+    """Percentil pelo método do posto mais próximo."""
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+def chave_do_caso(algoritmo: str, quadros: int, paginas: int, sequencia: str, acessos: int) -> str:
+    return f"{algoritmo}|{quadros}|{paginas}|{sequencia}|{acessos}"
+
+
+def medir_caso(alocador: AlocadorDePaginas, algoritmo: str, sequencia, aquecimento: int, repeticoes: int) -> dict:
+    """Executa o algoritmo aquecimento + repeticoes vezes, retornando a vazão (referências/s) mediana e de p95.
+    O p95 da vazão corresponde ao 5º percentil (as execuções mais lentas)."""
+    metodo = getattr(alocador, algoritmo)
+    for _ in range(aquecimento):
+        metodo(sequencia)
+
+    vazoes = []
+    for _ in range(repeticoes):
+        metodo(sequencia)
+        vazoes.append(len(sequencia) / (alocador.ultima_medicao["tempo_ns"] / 1e9))
+    return {"mediana": statistics.median(vazoes), "p95": percentil(vazoes, 5), "repeticoes": repeticoes}
+
+
+def executar_benchmark(quadros=QUADROS_PADRAO, razoes=RAZOES_PADRAO, sequencias=SEQUENCIAS_PADRAO,
+                       algoritmos=ALGORITMOS, acessos: int = 200_000, aquecimento: int = 1, repeticoes: int = 5,
+                       ao_medir=None) -> dict:
+    """Mede a vazão de cada algoritmo em cada combinação de quadros, razão páginas/quadros e sequência.
+    Retorna {chave do caso: medição}; ao_medir(chave, medição) é chamado após cada caso, se informado."""
+    resultados = {}
+    for num_quadros, razao, sequencia in itertools.product(quadros, razoes, sequencias):
+        paginas = int(num_quadros * razao)
+        alocador = AlocadorDePaginas(num_quadros, paginas, num_acessos=acessos)
+        traco = alocador.traco(getattr(alocador, nome_sequencia(sequencia)))
+        for algoritmo in algoritmos:
+            chave = chave_do_caso(algoritmo, num_quadros, paginas, traco.__name__, acessos)
+            resultados[chave] = medir_caso(alocador, algoritmo, traco, aquecimento, repeticoes)
+            if ao_medir:
+                ao_medir(chave, resultados[chave])
+    return resultados
+
+
+def comparar(resultados: dict, base: dict, limite: float) -> list:
+    """Compara as vazões medianas com as da base, retornando os casos que regrediram mais que o limite (fração)."""
+    regressoes = []
+    for chave, medicao in resultados.items():
+        anterior = base.get(chave)
+        if anterior and medicao["mediana"] < anterior["mediana"] * (1 - limite):
+            regressoes.append((chave, anterior["mediana"], medicao["mediana"]))
+    return regressoes
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de vazão dos algoritmos de substituição de páginas.")
+    parser.add_argument("--quadros", type=int, nargs="+", default=QUADROS_PADRAO, help="números de quadros")
+    parser.add_argument("--completo", action="store_true", help=f"usa a matriz completa de quadros {QUADROS_COMPLETO}")
+    parser.add_argument("--razoes", type=float, nargs="+", default=RAZOES_PADRAO, help="razões páginas/quadros")
+    parser.add_argument("--sequencias", nargs="+", default=SEQUENCIAS_PADRAO, help="tipos de sequência")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS), choices=list(ALGORITMOS))
+    parser.add_argument("--acessos", type=int, default=200_000, help="acessos por execução")
+    parser.add_argument("--aquecimento", type=int, default=1, help="execuções descartadas antes das medições")
+    parser.add_argument("--repeticoes", type=int, default=5, help="execuções medidas por caso")
+    parser.add_argument("--base", help="arquivo JSON de base para comparação")
+    parser.add_argument("--salvar-base", help="salva os resultados como nova base neste arquivo JSON")
+    parser.add_argument("--limite", type=float, default=0.2,
+                        help="queda máxima aceitável de vazão mediana em relação à base (padrão: 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    def imprimir(chave: str, medicao: dict) -> None:
+        print(f"{chave:60} mediana {medicao['mediana']:>14,.0f} ref/s   p95 {medicao['p95']:>14,.0f} ref/s", flush=True)
+
+    resultados = executar_benchmark(QUADROS_COMPLETO if args.completo else args.quadros, args.razoes,
+                                    args.sequencias, args.algoritmos, args.acessos, args.aquecimento,
+                                    args.repeticoes, imprimir)
+
+    if args.salvar_base:
+        with open(args.salvar_base, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2, sort_keys=True)
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar(resultados, base, args.limite)
+        for chave, anterior, atual in regressoes:
+            print(f"REGRESSÃO {chave}: {anterior:,.0f} -> {atual:,.0f} ref/s ({atual / anterior - 1:+.1%})")
+        if regressoes:
+            sys.exit(1)
+        print(f"\nSem regressões acima de {args.limite:.0%} em relação à base.")
+
+
+if __name__ == "__main__":
+    main()
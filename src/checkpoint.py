@@ -0,0 +1,120 @@
+import argparse
+import inspect
+import os
+import pickle
+import zlib
+from itertools import islice
+
+from fontes_de_traco import abrir_traco
+from politicas import POLITICAS
+
+
+# CHECKPOINTS DE SIMULAÇÕES LONGAS
+# Um checkpoint guarda o estado completo de uma política incremental (tabela ou filas, ponteiro, contadores e o estado
+# dos geradores aleatórios) junto com a posição no traço, em um arquivo binário compactado. Retomar a partir dele
+# produz exatamente os mesmos resultados da execução sem interrupção.
+# O arquivo usa pickle: só devem ser carregados checkpoints de origem confiável.
+
+ASSINATURA = b"CKPT1\n"
+
+
+def salvar(caminho: str, politica, posicao: int, **metadados) -> None:
+    """Salva o estado da política e a posição no traço (referências já processadas).
+    A escrita é atômica: o arquivo anterior só é substituído depois que o novo foi gravado por completo."""
+    dados = pickle.dumps({"politica": politica, "posicao": posicao, "metadados": metadados},
+                         protocol=pickle.HIGHEST_PROTOCOL)
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(ASSINATURA)
+        arquivo.write(zlib.compress(dados, 1))
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+
+
+def carregar(caminho: str) -> tuple:
+    """Carrega um checkpoint, retornando (política, posição no traço, metadados)."""
+    with open(caminho, "rb") as arquivo:
+        if arquivo.read(len(ASSINATURA)) != ASSINATURA:
+            raise ValueError(f"Arquivo não é um checkpoint: {caminho}")
+        estado = pickle.loads(zlib.decompress(arquivo.read()))
+    return estado["politica"], estado["posicao"], estado["metadados"]
+
+
+def executar(politica, sequencia, caminho: str, intervalo: int = 10_000_000, posicao: int = 0, **metadados) -> int:
+    """Simula a política sobre a sequência a partir da posição indicada, salvando um checkpoint a cada intervalo de
+    referências e ao final. Retorna a posição final (total de referências processadas).
+    Fontes com a_partir_de (fontes_de_traco.TracoBinario) começam direto na posição; nas demais, as referências
+    anteriores são lidas e descartadas."""
+    if hasattr(sequencia, "a_partir_de"):
+        paginas = sequencia.a_partir_de(posicao)
+    else:
+        paginas = islice(sequencia(), posicao, None)
+    while True:
+        processadas = politica.acessos
+        politica.acessar_lote(islice(paginas, intervalo))
+        processadas = politica.acessos - processadas
+        posicao += processadas
+        salvar(caminho, politica, posicao, **metadados)
+        if processadas < intervalo:
+            return posicao
+
+
+def retomar(caminho: str, sequencia, intervalo: int = 10_000_000):
+    """Continua a simulação de um checkpoint até o fim da sequência, retornando a política ao final."""
+    politica, posicao, metadados = carregar(caminho)
+    executar(politica, sequencia, caminho, intervalo, posicao, **metadados)
+    return politica
+
+
+def bifurcar(caminho: str, variantes: dict) -> dict:
+    """Cria cópias independentes da política aquecida de um checkpoint, uma por variante.
+    variantes mapeia o nome de cada variante a um número de quadros (aplicado com Politica.redimensionar, que remove
+    as páginas excedentes pela regra da política), a uma função que ajusta sua cópia, ou a None para manter a cópia
+    inalterada. Para mudar o número de quadros, a função também deve usar redimensionar: alterar num_quadros
+    diretamente deixa o estado da política inconsistente. Retorna {nome: (política, posição no traço)}."""
+    with open(caminho, "rb") as arquivo:
+        if arquivo.read(len(ASSINATURA)) != ASSINATURA:
+            raise ValueError(f"Arquivo não é um checkpoint: {caminho}")
+        dados = zlib.decompress(arquivo.read())
+
+    copias = {}
+    for nome, ajuste in variantes.items():
+        estado = pickle.loads(dados)  # Cada variante parte de uma cópia própria do estado
+        if isinstance(ajuste, int):
+            estado["politica"].redimensionar(ajuste)
+        elif ajuste is not None:
+            ajuste(estado["politica"])
+        copias[nome] = (estado["politica"], estado["posicao"])
+    return copias
+
+
+def main(argv=None) -> None:
+    """Simula uma política sobre um traço real, retomando do checkpoint se ele já existir.
+    As páginas são usadas sem renumeração (compactar_paginas), cujo estado não faz parte do checkpoint."""
+    parser = argparse.ArgumentParser(description="Simulação longa de uma política com checkpoints periódicos.")
+    parser.add_argument("politica", choices=list(POLITICAS))
+    parser.add_argument("traco", help="arquivo do traço")
+    parser.add_argument("--formato", default="binario32", choices=["binario32", "binario64", "lackey"])
+    parser.add_argument("--quadros", type=int, required=True, help="quadros na memória")
+    parser.add_argument("--semente", type=int, default=556677, help="semente das políticas com sorteios")
+    parser.add_argument("--checkpoint", required=True, help="arquivo de checkpoint (criado ou retomado)")
+    parser.add_argument("--intervalo", type=int, default=10_000_000, help="referências entre checkpoints")
+    args = parser.parse_args(argv)
+
+    sequencia = abrir_traco(args.traco, args.formato)
+    if os.path.exists(args.checkpoint):
+        politica, posicao, _ = carregar(args.checkpoint)
+        print(f"Retomando de {args.checkpoint} na referência {posicao:,}", flush=True)
+    else:
+        classe = POLITICAS[args.politica]
+        opcoes = {"semente": args.semente} if "semente" in inspect.signature(classe).parameters else {}
+        politica = classe(args.quadros, **opcoes)
+        posicao = 0
+
+    posicao = executar(politica, sequencia, args.checkpoint, args.intervalo, posicao)
+    print(f"{posicao:,} referências, {politica.falhas:,} falhas ({politica.taxa_falhas:.4%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from array import array
+
+
+# CURVAS DE FALHAS (MATTSON)
+# Algoritmos de pilha (LRU, ótimo) têm a propriedade de inclusão: o conteúdo da memória com c quadros está sempre contido
+# no conteúdo com c + 1 quadros. Assim, a profundidade d da página referenciada na pilha ("distância de pilha") indica
+# que o acesso é um acerto para todas as memórias com c >= d quadros, e basta uma passada pela sequência para obter o
+# número de falhas de todos os tamanhos de memória de uma vez.
+
+# Próximo uso dos acessos sem uso futuro: maior que qualquer posição (maior valor de um array "q")
+SEM_PROXIMO_USO = 2**63 - 1
+
+
+def proximos_usos(paginas) -> array:
+    """Calcula, em uma passada de trás para frente, a posição do próximo acesso à mesma página para cada acesso.
+    Acessos sem uso futuro recebem SEM_PROXIMO_USO. As posições ficam em um array de 8 bytes por acesso."""
+    proximos = array("q", [0]) * len(paginas)
+    ultimo_uso = {}
+    for posicao, pagina in zip(range(len(paginas) - 1, -1, -1), reversed(paginas)):
+        proximos[posicao] = ultimo_uso.get(pagina, SEM_PROXIMO_USO)
+        ultimo_uso[pagina] = posicao
+    return proximos
+
+
+def distancias_lru(paginas) -> tuple[list, int]:
+    """Calcula o histograma de distâncias de pilha do LRU com uma árvore de Fenwick indexada pelo tempo, O(log n) por acesso.
+    A árvore marca com 1 a posição do último acesso de cada página: a distância de um acesso é o número de páginas
+    distintas referenciadas desde o último acesso à mesma página, mais um.
+    Retorna (histograma, falhas_frias), onde histograma[d] é o número de acessos com distância d."""
+    n = len(paginas)
+    arvore = [0] * (n + 1)
+    ultimo_acesso = {}  # página -> posição (1..n) do último acesso
+    histograma = [0]
+    falhas_frias = 0
+
+    for tempo, pagina in enumerate(paginas, start=1):
+        anterior = ultimo_acesso.get(pagina)
+        if anterior is None:
+            falhas_frias += 1
+        else:
+            # Páginas distintas acessadas depois do último acesso = total de marcas - marcas até o último acesso
+            prefixo = 0
+            i = anterior
+            while i > 0:
+                prefixo += arvore[i]
+                i -= i & -i
+            distancia = len(ultimo_acesso) - prefixo + 1
+            if distancia >= len(histograma):
+                histograma.extend([0] * (distancia - len(histograma) + 1))
+            histograma[distancia] += 1
+
+            # Remove a marca do último acesso
+            i = anterior
+            while i <= n:
+                arvore[i] -= 1
+                i += i & -i
+
+        # Marca o acesso atual
+        i = tempo
+        while i <= n:
+            arvore[i] += 1
+            i += i & -i
+        ultimo_acesso[pagina] = tempo
+
+    return histograma, falhas_frias
+
+
+def distancias_otimo(paginas) -> tuple[list, int]:
+    """Calcula o histograma de distâncias de pilha do algoritmo ótimo (Belady) pelo método de Mattson.
+    A pilha é mantida em ordem de prioridade (próximo uso mais cedo no topo); a cada acesso a página vai ao topo
+    e as páginas acima da sua posição antiga são reacomodadas, descendo sempre a de próximo uso mais distante.
+    Custa O(d) por acesso, sendo d a distância do acesso. Retorna (histograma, falhas_frias)."""
+    proximos = proximos_usos(paginas)
+    proximo_uso = {}  # página -> posição do próximo acesso
+    pilha = []
+    histograma = [0]
+    falhas_frias = 0
+
+    for tempo, pagina in enumerate(paginas):
+        if pagina in proximo_uso:
+            profundidade = pilha.index(pagina)
+            distancia = profundidade + 1
+            if distancia >= len(histograma):
+                histograma.extend([0] * (distancia - len(histograma) + 1))
+            histograma[distancia] += 1
+        else:
+            falhas_frias += 1
+            profundidade = len(pilha)
+            pilha.append(pagina)
+        proximo_uso[pagina] = proximos[tempo]
+
+        # Desce a página do topo, trocando-a a cada nível pela de próximo uso mais distante
+        if profundidade:
+            carregada = pilha[0]
+            for nivel in range(1, profundidade):
+                atual = pilha[nivel]
+                if proximo_uso[atual] > proximo_uso[carregada]:
+                    pilha[nivel] = carregada
+                    carregada = atual
+            pilha[profundidade] = carregada
+            pilha[0] = pagina
+
+    return histograma, falhas_frias
+
+
+def falhas_por_quadros(histograma: list, falhas_frias: int, max_quadros: int) -> list:
+    """Converte o histograma de distâncias no número de falhas para cada número de quadros de 0 a max_quadros.
+    Com c quadros, falham os acessos frios e todos os acessos com distância maior que c."""
+    falhas = [0] * (max_quadros + 1)
+    # Começa com todos os acessos de distância finita contados como falha (c = 0)
+    restantes = sum(histograma)
+    for quadros in range(max_quadros + 1):
+        if quadros < len(histograma):
+            restantes -= histograma[quadros]
+        falhas[quadros] = falhas_frias + restantes
+    return falhas
@@ -0,0 +1,266 @@
+import random
+import heapq
+from array import array
+from collections import deque
+from itertools import chain, islice
+from operator import length_hint
+
+
+def tipo_para_bits(bits: int) -> str:
+    """Menor tipo de array sem sinal capaz de guardar valores com o número de bits indicado (1 a 64)."""
+    for tipo in ("B", "H", "I", "Q"):
+        if 1 <= bits <= array(tipo).itemsize * 8:
+            return tipo
+    raise ValueError(f"Número de bits inválido: {bits} (deve estar entre 1 e 64)")
+
+
+def coluna_de_zeros(tipo: str, tamanho: int) -> array:
+    """Cria uma coluna (array) de zeros do tipo indicado, sem passar por uma lista intermediária."""
+    return array(tipo, bytes(array(tipo).itemsize * tamanho))
+
+
+_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class SorteiosEmLote:
+    """Base das sequências infinitas de sorteios gerados em blocos, a partir de um gerador próprio com semente.
+    proximo() devolve o próximo sorteio sem laço em Python por sorteio. O estado (gerador no início do bloco atual
+    e sorteios já consumidos dele) pode ser salvo com pickle e restaurado, continuando exatamente a mesma sequência."""
+
+    def __init__(self, semente, tamanho_bloco: int) -> None:
+        self.aleatorio = random.Random(semente)
+        self.tamanho_bloco = tamanho_bloco
+        self.__iniciar()
+
+    def _gerar_bloco(self):
+        raise NotImplementedError
+
+    def __iniciar(self) -> None:
+        self.__estado_bloco = None  # Estado do gerador antes de sortear o bloco atual
+        self.__bloco = iter(())
+        self.__sorteios = chain.from_iterable(self.__blocos())
+        self.proximo = self.__sorteios.__next__
+
+    def avancar(self, quantidade: int):
+        """Consome quantidade (>= 1) sorteios de uma vez, retornando o último."""
+        deque(islice(self.__sorteios, quantidade - 1), maxlen=0)
+        return self.proximo()
+
+    def __blocos(self):
+        while True:
+            self.__estado_bloco = self.aleatorio.getstate()
+            self.__bloco = iter(self._gerar_bloco())
+            yield self.__bloco
+
+    def __getstate__(self) -> dict:
+        estado = {chave: valor for chave, valor in self.__dict__.items()
+                  if chave not in ("proximo", "_SorteiosEmLote__bloco", "_SorteiosEmLote__sorteios")}
+        estado["consumidos"] = self.tamanho_bloco - length_hint(self.__bloco) if self.__estado_bloco else 0
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        consumidos = estado.pop("consumidos")
+        estado_bloco = estado.pop("_SorteiosEmLote__estado_bloco")
+        self.__dict__.update(estado)
+        self.__iniciar()
+        if estado_bloco is not None:
+            # Sorteia de novo o bloco atual e descarta o que já tinha sido consumido
+            self.aleatorio.setstate(estado_bloco)
+            if consumidos:
+                self.avancar(consumidos)
+
+
+class BitsEmLote(SorteiosEmLote):
+    """Bits aleatórios (0 ou 1), sorteados tamanho_bloco de cada vez com getrandbits.
+    Com a mesma semente, produz sempre a mesma sequência de bits."""
+
+    def __init__(self, semente, tamanho_bloco: int = 1 << 16) -> None:
+        super().__init__(semente, tamanho_bloco)
+
+    def _gerar_bloco(self) -> bytes:
+        # Converte o inteiro sorteado para bytes de valor 0 ou 1, sem laço em Python
+        return format(self.aleatorio.getrandbits(self.tamanho_bloco), f"0{self.tamanho_bloco}b").encode().translate(_BITS)
+
+
+class InteirosEmLote(SorteiosEmLote):
+    """Inteiros aleatórios entre minimo e maximo (inclusive), sorteados tamanho_bloco de cada vez.
+    Com a mesma semente, produz sempre a mesma sequência de valores."""
+
+    def __init__(self, semente, minimo: int, maximo: int, tamanho_bloco: int = 4096) -> None:
+        self.valores = range(minimo, maximo + 1)
+        super().__init__(semente, tamanho_bloco)
+
+    def _gerar_bloco(self) -> list:
+        return self.aleatorio.choices(self.valores, k=self.tamanho_bloco)
+
+
+class FracoesEmLote(SorteiosEmLote):
+    """Frações aleatórias em [0, 1), sorteadas tamanho_bloco de cada vez, usadas para sortear posições em listas
+    (int(fração * tamanho)) sem a chamada a random.choice por sorteio.
+    Com a mesma semente, produz sempre a mesma sequência de valores."""
+
+    def __init__(self, semente, tamanho_bloco: int = 4096) -> None:
+        super().__init__(semente, tamanho_bloco)
+
+    def _gerar_bloco(self) -> list:
+        sortear = self.aleatorio.random
+        return [sortear() for _ in range(self.tamanho_bloco)]
+
+
+class IndiceContadores:
+    """Índice das páginas carregadas agrupadas pelo valor do contador, usado na escolha de vítimas do NFU e do envelhecimento.
+    Os grupos não vazios ficam em um dicionário e seus valores num heap de mínimo com remoção preguiçosa, refeito a
+    partir dos grupos quando passa do dobro deles.
+    Cada grupo é formado por partes (listas sem ordem, com a posição de cada página num índice, como em ConjuntoIndexado):
+    quando remapear junta grupos, apenas concatena suas listas de partes, e só as partes do grupo de menor contador são
+    unidas (as menores na maior), ao sortear uma vítima. Assim uma interrupção de clock custa O(grupos + partes),
+    e não O(páginas carregadas)."""
+
+    def __init__(self) -> None:
+        self.grupos = {}  # contador -> lista de partes com as páginas carregadas
+        self.__posicoes = {}  # página -> (parte que a contém, posição na parte)
+        self.__valores = []  # Heap com os valores de contador (pode conter valores já removidos)
+
+    def adicionar(self, pagina: int, contador: int) -> None:
+        partes = self.grupos.get(contador)
+        if partes is None:
+            parte = []
+            self.grupos[contador] = [parte]
+            heapq.heappush(self.__valores, contador)
+            if len(self.__valores) > 2 * len(self.grupos):
+                # Descarta os valores de grupos já esvaziados, que só sairiam do heap ao chegar ao topo
+                self.__valores = list(self.grupos)
+                heapq.heapify(self.__valores)
+        else:
+            parte = partes[-1]
+        self.__posicoes[pagina] = (parte, len(parte))
+        parte.append(pagina)
+
+    def remover(self, pagina: int, contador: int) -> None:
+        # Troca a página removida pela última da parte para remover em O(1)
+        parte, posicao = self.__posicoes.pop(pagina)
+        ultima = parte.pop()
+        if ultima != pagina:
+            parte[posicao] = ultima
+            self.__posicoes[ultima] = (parte, posicao)
+        elif not parte:
+            partes = self.grupos[contador]
+            if len(partes) == 1:
+                del self.grupos[contador]
+            else:
+                partes[:] = [outra for outra in partes if outra is not parte]
+
+    def mover(self, pagina: int, anterior: int, novo: int) -> None:
+        if anterior != novo:
+            self.remover(pagina, anterior)
+            self.adicionar(pagina, novo)
+
+    def mover_varios(self, movimentos) -> None:
+        """Aplica vários movimentos (página, contador anterior, contador novo) em sequência, com o mesmo resultado
+        de chamar mover para cada um. Usado nas interrupções de clock, que movem todas as páginas referenciadas."""
+        grupos, posicoes, valores = self.grupos, self.__posicoes, self.__valores
+        for pagina, anterior, novo in movimentos:
+            if anterior == novo:
+                continue
+            # Remoção (como em remover)
+            parte, posicao = posicoes.pop(pagina)
+            ultima = parte.pop()
+            if ultima != pagina:
+                parte[posicao] = ultima
+                posicoes[ultima] = (parte, posicao)
+            elif not parte:
+                partes = grupos[anterior]
+                if len(partes) == 1:
+                    del grupos[anterior]
+                else:
+                    partes[:] = [outra for outra in partes if outra is not parte]
+            # Inserção (como em adicionar)
+            partes = grupos.get(novo)
+            if partes is None:
+                parte = []
+                grupos[novo] = [parte]
+                heapq.heappush(valores, novo)
+                if len(valores) > 2 * len(grupos):
+                    self.__valores = valores = list(grupos)
+                    heapq.heapify(valores)
+            else:
+                parte = partes[-1]
+            posicoes[pagina] = (parte, len(parte))
+            parte.append(pagina)
+
+    def remapear(self, funcao) -> None:
+        """Aplica a mesma transformação (monótona) ao contador de todas as páginas, movendo grupos inteiros de uma vez.
+        Grupos que passam a ter o mesmo valor têm suas partes concatenadas, sem mover páginas."""
+        grupos = {}
+        for contador, partes in self.grupos.items():
+            novo = funcao(contador)
+            existente = grupos.get(novo)
+            if existente is not None:
+                existente.extend(partes)
+            else:
+                grupos[novo] = partes
+        self.grupos = grupos
+        self.__valores = list(grupos)
+        heapq.heapify(self.__valores)
+
+    def escolher_menor(self, proxima_fracao) -> int:
+        """Sorteia uma página entre as de menor contador, com a fração devolvida por proxima_fracao (FracoesEmLote)."""
+        while self.__valores[0] not in self.grupos:
+            heapq.heappop(self.__valores)
+        partes = self.grupos[self.__valores[0]]
+        if len(partes) > 1:
+            self.__unir(partes)
+        parte = partes[0]
+        return parte[int(proxima_fracao() * len(parte))]
+
+    def __unir(self, partes: list) -> None:
+        """Une as partes de um grupo na maior delas, movendo apenas as páginas das menores."""
+        maior = max(partes, key=len)
+        posicoes = self.__posicoes
+        for parte in partes:
+            if parte is not maior:
+                for pagina in parte:
+                    posicoes[pagina] = (maior, len(maior))
+                    maior.append(pagina)
+        partes[:] = [maior]
+
+
+class ConjuntoIndexado:
+    """Conjunto de páginas guardado em lista com índice de posições, permitindo inserção, remoção e sorteio em O(1).
+    Usado para manter as classes do NRU sem percorrer a tabela de páginas."""
+
+    def __init__(self) -> None:
+        self.paginas = []
+        self.__posicoes = {}  # página -> posição na lista
+
+    def __len__(self) -> int:
+        return len(self.paginas)
+
+    def adicionar(self, pagina: int) -> None:
+        self.__posicoes[pagina] = len(self.paginas)
+        self.paginas.append(pagina)
+
+    def adicionar_varias(self, paginas: list) -> None:
+        """Adiciona as páginas na ordem da lista, como chamadas seguidas a adicionar, sem laço em Python."""
+        inicio = len(self.paginas)
+        self.__posicoes.update(zip(paginas, range(inicio, inicio + len(paginas))))
+        self.paginas.extend(paginas)
+
+    def remover(self, pagina: int) -> None:
+        # Troca a página removida pela última da lista para remover em O(1)
+        posicao = self.__posicoes.pop(pagina)
+        ultima = self.paginas.pop()
+        if ultima != pagina:
+            self.paginas[posicao] = ultima
+            self.__posicoes[ultima] = posicao
+
+    def sortear(self, proxima_fracao) -> int:
+        """Sorteia uma página com a fração devolvida por proxima_fracao (FracoesEmLote)."""
+        return self.paginas[int(proxima_fracao() * len(self.paginas))]
+
+    def esvaziar(self) -> list:
+        """Remove todas as páginas do conjunto, retornando-as."""
+        paginas = self.paginas
+        self.paginas = []
+        self.__posicoes = {}
+        return paginas
@@ -0,0 +1,163 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from alocador_de_paginas import AlocadorDePaginas
+
+
+# Cenários predefinidos: número -> [quadros, páginas endereçáveis, gerador de sequência]
+CENARIOS = {
+    # Poucos quadros, paginas em 1.5x ou 2x
+    1: [64, 96, "sequencia_aleatoria"],
+    2: [64, 96, "sequencia_localizada"],
+    3: [64, 96, "sequencia_linear"],
+
+    4: [64, 128, "sequencia_aleatoria"],
+    5: [64, 128, "sequencia_localizada"],
+    6: [64, 128, "sequencia_linear"],
+
+    # Muitos quadros, paginas em 1.5x ou 2x
+    7: [1024, 1536, "sequencia_aleatoria"],
+    8: [1024, 1536, "sequencia_localizada"],
+    9: [1024, 1536, "sequencia_linear"],
+
+    10: [1024, 2048, "sequencia_aleatoria"],
+    11: [1024, 2048, "sequencia_localizada"],
+    12: [1024, 2048, "sequencia_linear"],
+}
+
+# Algoritmos de substituição: nome do método -> nome exibido
+ALGORITMOS = {
+    "fifo": "FIFO",
+    "segunda_chance": "Segunda Chance",
+    "relogio": "Relógio",
+    "nru": "NRU",
+    "lru_lista": "LRU com lista",
+    "nfu_contador": "NFU com contador",
+    "envelhecimento": "Envelhecimento",
+    "arc": "ARC",
+    "dois_q": "2Q",
+    "lirs": "LIRS",
+    "otimo": "Ótimo",
+}
+
+# Valores padrão dos parâmetros opcionais de um cenário
+PADROES = {
+    "num_acessos": 100_000,
+    "tempo_memoria": 100,
+    "tempo_tratamento": 8_000_000,
+    "semente": 556677,
+    "algoritmos": list(ALGORITMOS),
+}
+
+
+def nome_sequencia(nome: str) -> str:
+    """Aceita o nome do gerador com ou sem o prefixo 'sequencia_' (ex.: 'linear' ou 'sequencia_linear')."""
+    return nome if nome.startswith("sequencia_") else f"sequencia_{nome}"
+
+
+def _inteiro(parametros: dict, nome: str, minimo: int | None = None) -> int:
+    """Lê um parâmetro inteiro do cenário, com valor mínimo opcional, levantando ValueError se for inválido."""
+    valor = parametros[nome]
+    if isinstance(valor, bool):
+        raise ValueError(f"{nome} deve ser um número inteiro: {valor!r}")
+    try:
+        valor = int(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"{nome} deve ser um número inteiro: {valor!r}") from None
+    if minimo is not None and valor < minimo:
+        raise ValueError(f"{nome} deve ser no mínimo {minimo}: {valor}")
+    return valor
+
+
+def _tempo(parametros: dict, nome: str) -> int | float:
+    """Lê um tempo (ns) do cenário, que deve ser um número não negativo."""
+    valor = parametros[nome]
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)) or valor < 0:
+        raise ValueError(f"{nome} deve ser um número não negativo: {valor!r}")
+    return valor
+
+
+def tarefas_da_configuracao(cenarios: list) -> list:
+    """Cria as tarefas a partir de uma lista de cenários, cada um um dicionário com num_quadros, max_pag_novas e sequencia,
+    e opcionalmente num_acessos, tempo_memoria, tempo_tratamento, semente e algoritmos (lista de nomes de métodos)."""
+    if not isinstance(cenarios, list) or not all(isinstance(cenario, dict) for cenario in cenarios):
+        raise ValueError("A configuração deve ser uma lista de cenários (objetos JSON)")
+    tarefas = []
+    for numero, cenario in enumerate(cenarios, start=1):
+        parametros = {**PADROES, **cenario}
+        if not isinstance(parametros["sequencia"], str):
+            raise ValueError(f"Sequência desconhecida: {parametros['sequencia']!r}")
+        sequencia = nome_sequencia(parametros["sequencia"])
+        if not hasattr(AlocadorDePaginas, sequencia):
+            raise ValueError(f"Sequência desconhecida: {parametros['sequencia']}")
+        algoritmos = parametros["algoritmos"]
+        if not isinstance(algoritmos, list):
+            raise ValueError(f"algoritmos deve ser uma lista de nomes: {algoritmos!r}")
+        valores = {
+            "num_quadros": _inteiro(parametros, "num_quadros", 1),
+            "max_pag_novas": _inteiro(parametros, "max_pag_novas", 1),
+            "num_acessos": _inteiro(parametros, "num_acessos", 1),
+            "tempo_memoria": _tempo(parametros, "tempo_memoria"),
+            "tempo_tratamento": _tempo(parametros, "tempo_tratamento"),
+        }
+        semente = _inteiro(parametros, "semente")
+        for algoritmo in algoritmos:
+            if not isinstance(algoritmo, str) or algoritmo not in ALGORITMOS:
+                raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+            tarefas.append({
+                "cenario": parametros.get("cenario", numero),
+                "algoritmo": algoritmo,
+                **valores,
+                "sequencia": sequencia,
+                "semente": semente,
+            })
+    return tarefas
+
+
+def criar_tarefas(cenarios: dict = CENARIOS,
+                  algoritmos=ALGORITMOS,
+                  num_acessos: int = 100_000,
+                  tempo_memoria: int = 100,
+                  tempo_tratamento: int = 8_000_000,
+                  semente: int = 556677,
+                  ) -> list:
+    """Cria uma tarefa (cenário, algoritmo) para cada combinação, na ordem dos cenários e dos algoritmos.
+    Cada tarefa é um dicionário com todos os parâmetros necessários para executá-la isoladamente."""
+    return [
+        {
+            "cenario": cenario,
+            "algoritmo": algoritmo,
+            "num_quadros": quadros,
+            "max_pag_novas": paginas,
+            "num_acessos": num_acessos,
+            "tempo_memoria": tempo_memoria,
+            "tempo_tratamento": tempo_tratamento,
+            "sequencia": sequencia,
+            "semente": semente,
+        }
+        for cenario, [quadros, paginas, sequencia] in cenarios.items()
+        for algoritmo in algoritmos
+    ]
+
+
+def executar_tarefa(tarefa: dict) -> dict:
+    """Executa um algoritmo em um cenário, retornando a tarefa acrescida das métricas e do tempo de execução (ms).
+    O alocador e seus sorteios são criados a partir da própria tarefa, de modo que o resultado não depende
+    de qual processo a executa nem do que foi executado antes."""
+    alocador = AlocadorDePaginas(tarefa["num_quadros"],
+                                 tarefa["max_pag_novas"],
+                                 num_acessos=tarefa["num_acessos"],
+                                 tempo_memoria=tarefa["tempo_memoria"],
+                                 tempo_tratamento=tarefa["tempo_tratamento"],
+                                 semente=tarefa["semente"],
+                                 )
+    # O traço fica em cache no processo, sendo reaproveitado pelas próximas tarefas do mesmo cenário
+    sequencia = alocador.traco(getattr(alocador, tarefa["sequencia"]))
+    metricas, tempo_execucao = getattr(alocador, tarefa["algoritmo"])(sequencia)
+    return {**tarefa, **metricas, "execucao": tempo_execucao}
+
+
+def executar_em_paralelo(tarefas: list, max_processos: int | None = None):
+    """Distribui as tarefas entre processos, devolvendo os resultados na mesma ordem das tarefas à medida que ficam prontos.
+    Por padrão usa um processo por núcleo disponível."""
+    with ProcessPoolExecutor(max_workers=max_processos) as executor:
+        yield from executor.map(executar_tarefa, tarefas)
@@ -0,0 +1,129 @@
+import mmap
+import os
+import struct
+import sys
+from itertools import islice
+
+
+# FONTES DE TRAÇOS REAIS
+# Todas as fontes podem ser passadas no lugar de um gerador de sequência: chamar a fonte devolve um iterador sobre
+# as páginas referenciadas, lido diretamente do arquivo, com memória constante independentemente do tamanho do traço.
+# Os algoritmos baseados em tabela (nru, nfu_contador, envelhecimento) exigem páginas menores que max_pag_novas;
+# para traços com endereços esparsos, use compactar_paginas=True, que renumera as páginas na ordem em que aparecem
+# (neste caso a memória passa a crescer com o número de páginas distintas, não com o tamanho do traço).
+
+class _Renumerador:
+    """Renumera páginas de forma densa (0, 1, 2, ...) na ordem do primeiro acesso."""
+
+    def __init__(self) -> None:
+        self.numeros = {}
+
+    def __call__(self, paginas):
+        numeros = self.numeros
+        for pagina in paginas:
+            numero = numeros.get(pagina)
+            if numero is None:
+                numero = numeros[pagina] = len(numeros)
+            yield numero
+
+
+class TracoBinario:
+    """Traço binário de números de página little-endian de 32 ou 64 bits, mapeado em memória (mmap) e percorrido sem cópia."""
+
+    def __init__(self, caminho: str, bits: int = 32, compactar_paginas: bool = False) -> None:
+        if bits not in (32, 64):
+            raise ValueError("Traços binários devem ter páginas de 32 ou 64 bits")
+        self.caminho = caminho
+        self.__name__ = os.path.basename(caminho)
+        self.__tamanho_item = bits // 8
+        self.__formato = "I" if bits == 32 else "Q"
+        self.compactar_paginas = compactar_paginas
+
+    def __len__(self) -> int:
+        return os.path.getsize(self.caminho) // self.__tamanho_item
+
+    def __call__(self):
+        paginas = self.__paginas()
+        return _Renumerador()(paginas) if self.compactar_paginas else paginas
+
+    def a_partir_de(self, posicao: int):
+        """Iterador sobre as páginas a partir da posição indicada, sem ler as anteriores (usado ao retomar checkpoints).
+        Com compactar_paginas, a renumeração depende das páginas anteriores, e elas são percorridas."""
+        if self.compactar_paginas:
+            return islice(self(), posicao, None)
+        return self.__paginas(posicao)
+
+    def __paginas(self, inicio: int = 0):
+        tamanho = len(self) * self.__tamanho_item
+        inicio = min(inicio * self.__tamanho_item, tamanho)
+        if tamanho == inicio:
+            return
+        with open(self.caminho, "rb") as arquivo, \
+                mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            dados = memoryview(mapa)[inicio:tamanho]
+            try:
+                if sys.byteorder == "little":
+                    # Reinterpreta os bytes do arquivo como inteiros, sem copiá-los
+                    paginas = dados.cast(self.__formato)
+                    try:
+                        yield from paginas
+                    finally:
+                        paginas.release()
+                else:
+                    for (pagina,) in struct.iter_unpack("<" + self.__formato, dados):
+                        yield pagina
+            finally:
+                dados.release()
+
+
+class TracoLackey:
+    """Traço de endereços no formato do Valgrind lackey (--trace-mem=yes), lido em blocos grandes.
+    Cada linha contém o tipo de acesso (I, L, S ou M) seguido de 'endereço,tamanho' em hexadecimal;
+    o número da página é o endereço dividido pelo tamanho da página. Linhas de outros tipos são ignoradas."""
+
+    def __init__(self, caminho: str, tamanho_pagina: int = 4096, tipos: str = "ILSM",
+                 compactar_paginas: bool = False, tamanho_bloco: int = 1 << 24) -> None:
+        if tamanho_pagina & (tamanho_pagina - 1):
+            raise ValueError("O tamanho da página deve ser uma potência de 2")
+        self.caminho = caminho
+        self.__name__ = os.path.basename(caminho)
+        self.__deslocamento = tamanho_pagina.bit_length() - 1
+        self.__tipos = set(tipos.encode())
+        self.compactar_paginas = compactar_paginas
+        self.tamanho_bloco = tamanho_bloco
+
+    def __call__(self):
+        paginas = self.__paginas()
+        return _Renumerador()(paginas) if self.compactar_paginas else paginas
+
+    def contar(self) -> int:
+        """Conta os acessos do traço (percorre o arquivo uma vez), para ajustar num_acessos do alocador."""
+        return sum(1 for _ in self.__paginas())
+
+    def __paginas(self):
+        deslocamento = self.__deslocamento
+        tipos = self.__tipos
+        with open(self.caminho, "rb") as arquivo:
+            # readlines com limite lê o arquivo em blocos de linhas inteiras
+            while linhas := arquivo.readlines(self.tamanho_bloco):
+                for linha in linhas:
+                    campos = linha.split()
+                    if len(campos) != 2 or len(campos[0]) != 1 or campos[0][0] not in tipos:
+                        continue
+                    endereco = campos[1].split(b",", 1)[0]
+                    try:
+                        yield int(endereco, 16) >> deslocamento
+                    except ValueError:
+                        continue
+
+
+def abrir_traco(caminho: str, formato: str, **opcoes):
+    """Abre um traço real pelo nome do formato: 'binario32', 'binario64' ou 'lackey'."""
+    match formato:
+        case "binario32":
+            return TracoBinario(caminho, 32, **opcoes)
+        case "binario64":
+            return TracoBinario(caminho, 64, **opcoes)
+        case "lackey":
+            return TracoLackey(caminho, **opcoes)
+    raise ValueError(f"Formato de traço desconhecido: {formato}")
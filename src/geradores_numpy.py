@@ -0,0 +1,92 @@
+from array import array
+
+import numpy as np
+
+from traco import Traco, cache_de_tracos
+
+
+# GERADORES VETORIZADOS
+# Cada gerador recebe um numpy.random.Generator próprio e devolve um vetor uint32 de páginas, gerado de uma só vez.
+
+def sequencia_aleatoria(rng: np.random.Generator, num_acessos: int, max_pag_novas: int) -> np.ndarray:
+    """Versão vetorizada da sequência aleatória: páginas uniformes dentro da faixa de páginas endereçáveis."""
+    return rng.integers(0, max_pag_novas, size=num_acessos, dtype=np.uint32)
+
+
+def sequencia_localizada(rng: np.random.Generator, num_acessos: int, max_pag_novas: int) -> np.ndarray:
+    """Versão vetorizada da sequência localizada: passeio aleatório obtido pela soma acumulada dos passos.
+    Assim como a versão original, os passos ficam na faixa de 1/8 do total de páginas."""
+    localidade = max_pag_novas // 8
+    pagina = rng.integers(0, max_pag_novas)
+    passos = rng.integers(-localidade, localidade + 1, size=num_acessos, dtype=np.int64)
+    return ((pagina + np.cumsum(passos)) % max_pag_novas).astype(np.uint32)
+
+
+def sequencia_linear(rng: np.random.Generator, num_acessos: int, max_pag_novas: int) -> np.ndarray:
+    """Versão vetorizada da sequência linear: páginas consecutivas a partir de uma página aleatória."""
+    pag_inicial = rng.integers(0, max_pag_novas)
+    return ((pag_inicial + np.arange(num_acessos, dtype=np.int64)) % max_pag_novas).astype(np.uint32)
+
+
+def sequencia_zipf(rng: np.random.Generator, num_acessos: int, max_pag_novas: int,
+                   expoente: float = 1.0) -> np.ndarray:
+    """Sequência com popularidade de Zipf: a k-ésima página mais popular é acessada com probabilidade proporcional a 1/k^expoente.
+    As páginas populares são espalhadas pelo espaço de endereçamento com uma permutação aleatória."""
+    pesos = 1.0 / np.arange(1, max_pag_novas + 1, dtype=np.float64) ** expoente
+    acumulado = np.cumsum(pesos)
+    acumulado /= acumulado[-1]
+
+    # Amostragem pela inversa da distribuição acumulada
+    posicoes = np.searchsorted(acumulado, rng.random(num_acessos), side="right")
+    np.minimum(posicoes, max_pag_novas - 1, out=posicoes)
+    paginas = rng.permutation(max_pag_novas).astype(np.uint32)
+    return paginas[posicoes]
+
+
+def sequencia_fases(rng: np.random.Generator, num_acessos: int, max_pag_novas: int,
+                    num_fases: int = 10, tamanho_conjunto: int | None = None) -> np.ndarray:
+    """Sequência com mudanças de fase do conjunto de trabalho: o tempo é dividido em fases iguais,
+    e em cada fase os acessos são uniformes dentro de um conjunto contíguo de páginas com início aleatório.
+    Por padrão o conjunto de trabalho tem 1/4 do total de páginas."""
+    if tamanho_conjunto is None:
+        tamanho_conjunto = max(1, max_pag_novas // 4)
+    inicios = rng.integers(0, max_pag_novas, size=num_fases, dtype=np.int64)
+    fases = np.arange(num_acessos, dtype=np.int64) * num_fases // num_acessos
+    deslocamentos = rng.integers(0, tamanho_conjunto, size=num_acessos, dtype=np.int64)
+    return ((inicios[fases] + deslocamentos) % max_pag_novas).astype(np.uint32)
+
+
+def sequencia_laco(rng: np.random.Generator, num_acessos: int, max_pag_novas: int,
+                   tamanho_laco: int | None = None) -> np.ndarray:
+    """Sequência de varredura em laço: percorre repetidamente as mesmas páginas consecutivas, a partir de uma página aleatória.
+    Por padrão o laço cobre todas as páginas endereçáveis."""
+    if tamanho_laco is None:
+        tamanho_laco = max_pag_novas
+    pag_inicial = rng.integers(0, max_pag_novas)
+    return ((pag_inicial + np.arange(num_acessos, dtype=np.int64) % tamanho_laco) % max_pag_novas).astype(np.uint32)
+
+
+# Geradores disponíveis por nome, com a semente padrão de cada um
+GERADORES = {
+    "aleatoria": (sequencia_aleatoria, 112233),
+    "localizada": (sequencia_localizada, 445566),
+    "linear": (sequencia_linear, 778899),
+    "zipf": (sequencia_zipf, 101112),
+    "fases": (sequencia_fases, 131415),
+    "laco": (sequencia_laco, 161718),
+}
+
+
+def gerar(nome: str, num_acessos: int, max_pag_novas: int, semente: int | None = None, **parametros) -> Traco:
+    """Gera (ou obtém do cache) o traço do gerador vetorizado indicado, pronto para ser passado aos algoritmos.
+    Cada traço usa seu próprio numpy.random.Generator, sem alterar o estado do random global."""
+    funcao, semente_padrao = GERADORES[nome]
+    if semente is None:
+        semente = semente_padrao
+    chave = (f"numpy_{nome}", semente, num_acessos, max_pag_novas, tuple(sorted(parametros.items())))
+
+    def criar() -> Traco:
+        paginas = funcao(np.random.default_rng(semente), num_acessos, max_pag_novas, **parametros)
+        return Traco(f"sequencia_{nome}", array("I", paginas.astype(np.uint32, copy=False).tobytes()), semente)
+
+    return cache_de_tracos.obter(chave, criar)
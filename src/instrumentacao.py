@@ -0,0 +1,44 @@
+import cProfile
+import os
+import time
+import tracemalloc
+
+
+class Instrumentacao:
+    """Configura as medições extras feitas pelo decorador medir_tempo de AlocadorDePaginas:
+    - memoria: pico de memória alocada durante a execução (tracemalloc, que também deixa a execução mais lenta);
+    - operacoes: contadores de operações de cada algoritmo (acertos, falhas, remoções, passos do ponteiro, etc.);
+    - perfil: diretório onde salvar o perfil (cProfile) de cada execução, em '<algoritmo>.prof'.
+    Sem instrumentação, o decorador mede apenas o tempo, e os contadores não são incluídos nas métricas."""
+
+    def __init__(self, memoria: bool = False, operacoes: bool = False, perfil: str | None = None) -> None:
+        self.memoria = memoria
+        self.operacoes = operacoes
+        self.perfil = perfil
+
+    def medir(self, nome: str, funcao, *args, **kwargs) -> tuple:
+        """Executa a função com as medições configuradas, retornando (resultado, medição)."""
+        perfilador = cProfile.Profile() if self.perfil else None
+        memoria_pico = None
+        if self.memoria:
+            tracemalloc.start()
+        try:
+            inicio = time.perf_counter_ns()
+            if perfilador:
+                resultado = perfilador.runcall(funcao, *args, **kwargs)
+            else:
+                resultado = funcao(*args, **kwargs)
+            final = time.perf_counter_ns()
+            if self.memoria:
+                memoria_pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            # Uma exceção no algoritmo não deixa o rastreamento ligado (e as execuções seguintes lentas)
+            if self.memoria:
+                tracemalloc.stop()
+
+        medicao = {"algoritmo": nome, "tempo_ns": final - inicio, "memoria_pico": memoria_pico, "perfil": None}
+        if perfilador:
+            os.makedirs(self.perfil, exist_ok=True)
+            medicao["perfil"] = os.path.join(self.perfil, f"{nome}.prof")
+            perfilador.dump_stats(medicao["perfil"])
+        return resultado, medicao
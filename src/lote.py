@@ -0,0 +1,134 @@
+import argparse
+import csv
+import itertools
+import json
+import sys
+
+from executor import (CENARIOS, ALGORITMOS, PADROES, criar_tarefas, tarefas_da_configuracao,
+                      executar_tarefa, executar_em_paralelo)
+from varredura import CacheDeResultados, executar_com_cache
+
+
+# Campos de cada registro de saída, na ordem das colunas do CSV
+CAMPOS = [
+    "cenario", "algoritmo", "num_quadros", "max_pag_novas", "num_acessos", "tempo_memoria",
+    "tempo_tratamento", "sequencia", "semente", "total", "porcentagem", "acesso", "execucao",
+]
+
+def inteiro_positivo(texto: str) -> int:
+    """Tipo dos argumentos de contagem (quadros, páginas, acessos): inteiros a partir de 1."""
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número inteiro inválido: {texto!r}") from None
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"deve ser positivo: {valor}")
+    return valor
+
+
+def tarefas_dos_argumentos(args: argparse.Namespace) -> list:
+    """Cria as tarefas da combinação de todos os valores passados na linha de comando (quadros x páginas x acessos x sequências)."""
+    cenarios = [
+        {
+            "num_quadros": quadros,
+            "max_pag_novas": paginas,
+            "num_acessos": acessos,
+            "tempo_memoria": args.tempo_memoria,
+            "tempo_tratamento": args.tempo_tratamento,
+            "sequencia": sequencia,
+            "semente": args.semente,
+            "algoritmos": args.algoritmos,
+        }
+        for quadros, paginas, acessos, sequencia in itertools.product(
+            args.quadros, args.paginas, args.acessos, args.sequencia)
+    ]
+    return tarefas_da_configuracao(cenarios)
+
+
+def escrever_resultados(resultados, saida, formato: str) -> int:
+    """Escreve um registro por resultado, assim que cada um fica pronto. Retorna o número de registros escritos."""
+    escritor = None
+    if formato == "csv":
+        escritor = csv.DictWriter(saida, fieldnames=CAMPOS, extrasaction="ignore")
+        escritor.writeheader()
+
+    quantidade = 0
+    for resultado in resultados:
+        if escritor:
+            escritor.writerow(resultado)
+        else:
+            saida.write(json.dumps({campo: resultado[campo] for campo in CAMPOS}, ensure_ascii=False) + "\n")
+        saida.flush()
+        quantidade += 1
+    return quantidade
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Executa o simulador de alocação de páginas sem interação, emitindo um registro por (cenário, algoritmo).")
+    origem = parser.add_mutually_exclusive_group()
+    origem.add_argument("--config", help="arquivo JSON com a lista de cenários")
+    origem.add_argument("--predefinidos", action="store_true", help="executa os 12 cenários predefinidos")
+
+    parser.add_argument("--quadros", type=inteiro_positivo, nargs="+", help="quadros na memória")
+    parser.add_argument("--paginas", type=inteiro_positivo, nargs="+", help="páginas endereçáveis")
+    parser.add_argument("--acessos", type=inteiro_positivo, nargs="+", default=[PADROES["num_acessos"]], help="número de acessos")
+    parser.add_argument("--sequencia", nargs="+", default=["aleatoria"],
+                        help="tipo de sequência (aleatoria, localizada, linear)")
+    parser.add_argument("--tempo-memoria", type=int, default=PADROES["tempo_memoria"], help="tempo de acesso à memória (ns)")
+    parser.add_argument("--tempo-tratamento", type=int, default=PADROES["tempo_tratamento"],
+                        help="tempo de tratamento de falha de página (ns)")
+    parser.add_argument("--semente", type=int, default=PADROES["semente"], help="semente dos sorteios dos algoritmos")
+    parser.add_argument("--algoritmos", nargs="+", default=PADROES["algoritmos"], choices=list(ALGORITMOS),
+                        help="algoritmos a executar (padrão: todos)")
+
+    parser.add_argument("--formato", choices=["jsonl", "csv"], default="jsonl", help="formato da saída")
+    parser.add_argument("--saida", help="arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--processos", type=int, default=1,
+                        help="número de processos (0 = um por núcleo, padrão: 1)")
+    parser.add_argument("--cache", help="banco SQLite de resultados: apenas os pontos ausentes são simulados")
+    return parser
+
+
+def main(argv=None) -> None:
+    """Ponto de entrada não interativo do simulador."""
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.config:
+            with open(args.config, encoding="utf-8") as arquivo:
+                tarefas = tarefas_da_configuracao(json.load(arquivo))
+        elif args.predefinidos:
+            if len(args.acessos) > 1:
+                parser.error("--predefinidos aceita um único valor de --acessos")
+            tarefas = criar_tarefas(CENARIOS, args.algoritmos, args.acessos[0],
+                                    args.tempo_memoria, args.tempo_tratamento, args.semente)
+        elif args.quadros and args.paginas:
+            tarefas = tarefas_dos_argumentos(args)
+        else:
+            parser.error("informe --config, --predefinidos ou --quadros e --paginas")
+    except (OSError, ValueError, KeyError) as erro:
+        parser.error(f"configuração inválida: {erro}")
+
+    cache = CacheDeResultados(args.cache) if args.cache else None
+    if cache:
+        resultados = executar_com_cache(tarefas, cache, args.processos)
+    elif args.processos == 1:
+        resultados = map(executar_tarefa, tarefas)
+    else:
+        resultados = executar_em_paralelo(tarefas, args.processos or None)
+
+    try:
+        if args.saida:
+            with open(args.saida, "w", newline="", encoding="utf-8") as saida:
+                escrever_resultados(resultados, saida, args.formato)
+        else:
+            escrever_resultados(resultados, sys.stdout, args.formato)
+    finally:
+        if cache:
+            cache.fechar()
+
+
+if __name__ == "__main__":
+    main()
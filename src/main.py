@@ -1,5 +1,6 @@
 from tabulate import tabulate
 from alocador_de_paginas import AlocadorDePaginas
+from executor import CENARIOS, ALGORITMOS, criar_tarefas, executar_em_paralelo
 
 
 def main():
@@ -10,7 +11,7 @@ def main():
 
     print("\nQual tipo de cenário deseja simular?")
     tipo_cenario = input(
-        "1 = PREDEFINIDO | 2 = PERSONALIZADO | outro = SAIR: ")
+        "1 = PREDEFINIDO | 2 = PERSONALIZADO | 3 = PREDEFINIDOS EM PARALELO | outro = SAIR: ")
 
     if tipo_cenario == "1":
         print("\n\nCENÁRIOS PREDEFINIDOS")
@@ -23,34 +24,14 @@ def main():
         # Instanciar alocador com valores quaisquer
         alocador = AlocadorDePaginas(16, 32)
 
-        # CENÁRIOS PREDEFINIDOS
-        cenarios = {
-            # Poucos quadros, paginas em 1.5x ou 2x
-            1: [64, 96, alocador.sequencia_aleatoria],
-            2: [64, 96, alocador.sequencia_localizada],
-            3: [64, 96, alocador.sequencia_linear],
-
-            4: [64, 128, alocador.sequencia_aleatoria],
-            5: [64, 128, alocador.sequencia_localizada],
-            6: [64, 128, alocador.sequencia_linear],
-
-            # Muitos quadros, paginas em 1.5x ou 2x
-            7: [1024, 1536, alocador.sequencia_aleatoria],
-            8: [1024, 1536, alocador.sequencia_localizada],
-            9: [1024, 1536, alocador.sequencia_linear],
-            
-            10: [1024, 2048, alocador.sequencia_aleatoria],
-            11: [1024, 2048, alocador.sequencia_localizada],
-            12: [1024, 2048, alocador.sequencia_linear],
-        }
-
-        for cenario, [quadros, paginas, sequencia] in cenarios.items():
+        for cenario, [quadros, paginas, sequencia] in CENARIOS.items():
             # Pausa ausa entre cada cenário
             input("\nAperte ENTER para calcular próximo cenário: ")
 
             # Carregar parâmetros do cenário no alocador
             alocador.num_quadros = quadros
             alocador.max_pag_novas = paginas
+            sequencia = getattr(alocador, sequencia)
 
             # Descrição
             print(f"\n\CENÁRIO {cenario}")
@@ -59,6 +40,9 @@ def main():
             print(f"- Páginas endereçáveis: {paginas}")
             print(f"- Tipo de sequência de acesso: {sequencia.__name__}\n\n")
 
+            # Gerar a sequência uma única vez e reproduzi-la em todos os algoritmos
+            sequencia = alocador.traco(sequencia)
+
             # Rodar algoritmos
             fifo, tempo_fifo = alocador.fifo(sequencia)
             seg_chance, tempo_seg_chance = alocador.segunda_chance(sequencia)
@@ -68,6 +52,10 @@ def main():
             nfu_contador, tempo_nfu_contador = alocador.nfu_contador(sequencia)
             envelhecimento, tempo_envelhecimento = alocador.envelhecimento(
                 sequencia)
+            arc, tempo_arc = alocador.arc(sequencia)
+            dois_q, tempo_dois_q = alocador.dois_q(sequencia)
+            lirs, tempo_lirs = alocador.lirs(sequencia)
+            otimo, tempo_otimo = alocador.otimo(sequencia)
 
             # Organizar dados em linhas
             cabecalho = [
@@ -91,6 +79,11 @@ def main():
                     nfu_contador['acesso'], tempo_nfu_contador],
                 ["Envelhecimento", envelhecimento['total'], envelhecimento['porcentagem'],
                     envelhecimento['acesso'], tempo_envelhecimento],
+                ["ARC", arc['total'], arc['porcentagem'], arc['acesso'], tempo_arc],
+                ["2Q", dois_q['total'], dois_q['porcentagem'], dois_q['acesso'], tempo_dois_q],
+                ["LIRS", lirs['total'], lirs['porcentagem'], lirs['acesso'], tempo_lirs],
+                ["Ótimo", otimo['total'], otimo['porcentagem'],
+                    otimo['acesso'], tempo_otimo],
             ]
 
             # Imprimir resultados (em formato de tabela)
@@ -137,6 +130,9 @@ def main():
                 case 3:
                     seq = pers_alocador.sequencia_linear
 
+            # Gerar a sequência uma única vez e reproduzi-la em todos os algoritmos
+            seq = pers_alocador.traco(seq)
+
             # Rodar algoritmos
             pers_fifo, tempo_pers_fifo = pers_alocador.fifo(seq)
             pers_seg_chance, tempo_pers_seg_chance = pers_alocador.segunda_chance(
@@ -148,6 +144,10 @@ def main():
                 seq)
             pers_envelhecimento, tempo_pers_envelhecimento = pers_alocador.envelhecimento(
                 seq)
+            pers_arc, tempo_pers_arc = pers_alocador.arc(seq)
+            pers_dois_q, tempo_pers_dois_q = pers_alocador.dois_q(seq)
+            pers_lirs, tempo_pers_lirs = pers_alocador.lirs(seq)
+            pers_otimo, tempo_pers_otimo = pers_alocador.otimo(seq)
 
             # Organizar dados em linhas
             cabecalho = [
@@ -172,6 +172,14 @@ def main():
                     pers_nfu_contador['acesso'], tempo_pers_nfu_contador],
                 ["Envelhecimento", pers_envelhecimento['total'], pers_envelhecimento['porcentagem'],
                     pers_envelhecimento['acesso'], tempo_pers_envelhecimento],
+                ["ARC", pers_arc['total'], pers_arc['porcentagem'],
+                    pers_arc['acesso'], tempo_pers_arc],
+                ["2Q", pers_dois_q['total'], pers_dois_q['porcentagem'],
+                    pers_dois_q['acesso'], tempo_pers_dois_q],
+                ["LIRS", pers_lirs['total'], pers_lirs['porcentagem'],
+                    pers_lirs['acesso'], tempo_pers_lirs],
+                ["Ótimo", pers_otimo['total'], pers_otimo['porcentagem'],
+                    pers_otimo['acesso'], tempo_pers_otimo],
             ]
 
             # Imprimir resultados (em formato de tabela)
@@ -183,6 +191,34 @@ def main():
             if not input("\nS = SIM | outro = NÃO: ").lower() == "s":
                 quit()
 
+    # CENÁRIOS PREDEFINIDOS EM PARALELO
+    elif tipo_cenario == "3":
+        print("\n\nCENÁRIOS PREDEFINIDOS EM PARALELO")
+        print("===================================")
+        print("\nTodos os cenários e algoritmos são executados em paralelo, um processo por núcleo.")
+
+        cabecalho = [
+            "ALGORITMO",
+            "Falhas (total)",
+            "Falhas (%)",
+            "Acesso (ms)",
+            "Execução (ms)",
+        ]
+        resultados = []
+
+        # Resultados chegam na ordem dos cenários: imprime cada tabela assim que o cenário termina
+        for resultado in executar_em_paralelo(criar_tarefas()):
+            resultados.append([ALGORITMOS[resultado["algoritmo"]], resultado["total"],
+                               resultado["porcentagem"], resultado["acesso"], resultado["execucao"]])
+            if len(resultados) == len(ALGORITMOS):
+                print(f"\n\nCENÁRIO {resultado['cenario']}")
+                print(f"=============")
+                print(f"\n- Quadros na memória: {resultado['num_quadros']}")
+                print(f"- Páginas endereçáveis: {resultado['max_pag_novas']}")
+                print(f"- Tipo de sequência de acesso: {resultado['sequencia']}\n\n")
+                print(tabulate(resultados, headers=cabecalho))
+                resultados = []
+
     else:
         quit()
 
@@ -0,0 +1,231 @@
+import argparse
+import heapq
+import inspect
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+from alocador_de_paginas import AlocadorDePaginas
+from politicas import POLITICAS
+
+
+# MULTIPROGRAMAÇÃO
+# Vários processos, cada um com suas páginas (0 a max_pag_novas - 1), dividem os quadros da memória física.
+# As referências dos processos são intercaladas por um escalonador que consome os fluxos de forma preguiçosa,
+# uma fatia por vez, sem materializar as sequências. Duas formas de substituição:
+# - global: uma única política sobre todos os quadros; as chaves são páginas marcadas com o processo
+#   (pagina << bits | processo), e um processo pode tomar quadros de outro;
+# - local: cada processo tem sua cota de quadros e sua própria política, e só substitui as próprias páginas.
+# O thrashing é detectado por janelas de referências: uma janela com taxa de falhas acima do limiar conta como
+# thrashing, tanto por processo quanto no sistema como um todo.
+
+def escalonar_por_fatias(fluxos, quantum: int = 1000):
+    """Escalonamento circular (round-robin): cada processo referencia até quantum páginas por vez, na ordem dos fluxos.
+    Gera pares (processo, fatia de páginas); processos cujo fluxo termina saem da fila."""
+    fila = deque(enumerate(map(iter, fluxos)))
+    while fila:
+        processo, paginas = fila.popleft()
+        fatia = list(islice(paginas, quantum))
+        if fatia:
+            yield processo, fatia
+        if len(fatia) == quantum:
+            fila.append((processo, paginas))
+
+
+def intercalar_por_tempo(fluxos):
+    """Intercala fluxos de pares (instante, página), um por processo, em ordem de instante (heapq.merge, que guarda só
+    o próximo par de cada fluxo). Gera pares (processo, fatia) com as referências consecutivas de um mesmo processo."""
+    def marcar(processo, fluxo):
+        for instante, pagina in fluxo:
+            yield instante, processo, pagina
+
+    marcados = [marcar(processo, fluxo) for processo, fluxo in enumerate(fluxos)]
+    processo_atual = None
+    fatia = []
+    for _, processo, pagina in heapq.merge(*marcados, key=itemgetter(0)):
+        if processo != processo_atual:
+            if fatia:
+                yield processo_atual, fatia
+            processo_atual, fatia = processo, []
+        fatia.append(pagina)
+    if fatia:
+        yield processo_atual, fatia
+
+
+def fluxos_sinteticos(num_processos: int, max_pag_novas: int, num_acessos: int,
+                      sequencia: str = "sequencia_localizada", semente: int | None = None) -> list:
+    """Cria um gerador de referências por processo com os geradores de AlocadorDePaginas, cada um com sua semente
+    (semente padrão do gerador + número do processo). Os geradores só produzem as páginas à medida que são consumidos."""
+    alocador = AlocadorDePaginas(1, max_pag_novas, num_acessos=num_acessos)
+    gerador = getattr(alocador, sequencia)
+    if semente is None:
+        semente = inspect.signature(gerador).parameters["semente"].default
+    return [gerador(semente + processo) for processo in range(num_processos)]
+
+
+def dividir_quadros(num_quadros: int, num_processos: int) -> list:
+    """Cotas iguais de quadros (as que sobram da divisão vão para os primeiros processos)."""
+    base, resto = divmod(num_quadros, num_processos)
+    return [base + (processo < resto) for processo in range(num_processos)]
+
+
+class Multiprogramacao:
+    """Simula processos dividindo a memória física, com substituição global ou local (cotas por processo).
+    A cada janela de referências de um processo (e do sistema), fechada ao fim da fatia em que se completa, a taxa de
+    falhas da janela é comparada com limiar_thrashing; se estiver acima, a janela conta como thrashing e
+    ao_detectar_thrashing(processo, acessos, taxa) é chamada (processo None para o sistema)."""
+
+    def __init__(self, num_quadros: int, num_processos: int, algoritmo: str = "lru_lista",
+                 substituicao: str = "global", cotas=None, semente: int = 556677, janela: int = 10_000,
+                 limiar_thrashing: float = 0.5, ao_detectar_thrashing=None) -> None:
+        if substituicao not in ("global", "local"):
+            raise ValueError(f"Substituição inválida: {substituicao} (global ou local)")
+        if num_processos < 1:
+            raise ValueError("Deve haver ao menos um processo")
+
+        self.num_quadros = num_quadros
+        self.num_processos = num_processos
+        self.algoritmo = algoritmo
+        self.substituicao = substituicao
+        self.janela = janela
+        self.limiar_thrashing = limiar_thrashing
+        self.ao_detectar_thrashing = ao_detectar_thrashing
+
+        classe = POLITICAS[algoritmo]
+        com_semente = "semente" in inspect.signature(classe).parameters
+        if substituicao == "global":
+            self.cotas = None
+            self.politica = classe(num_quadros, **({"semente": semente} if com_semente else {}))
+            self.__fator = 1 << max(1, (num_processos - 1).bit_length())  # Marca o processo nos bits baixos
+        else:
+            self.cotas = list(cotas) if cotas is not None else dividir_quadros(num_quadros, num_processos)
+            if len(self.cotas) != num_processos or sum(self.cotas) > num_quadros or min(self.cotas) < 1:
+                raise ValueError("As cotas devem ter um valor positivo por processo e somar no máximo num_quadros")
+            self.politicas = [classe(cota, **({"semente": semente + processo} if com_semente else {}))
+                              for processo, cota in enumerate(self.cotas)]
+
+        # Contadores por processo (listas indexadas pelo número do processo)
+        self.acessos = [0] * num_processos
+        self.falhas = [0] * num_processos
+        self.janelas = [0] * num_processos
+        self.janelas_thrashing = [0] * num_processos
+        self.__acessos_janela = [0] * num_processos
+        self.__falhas_janela = [0] * num_processos
+
+        # Contadores do sistema
+        self.janelas_sistema = 0
+        self.janelas_thrashing_sistema = 0
+        self.__acessos_janela_sistema = 0
+        self.__falhas_janela_sistema = 0
+
+    def executar(self, fatias) -> None:
+        """Processa uma sequência de pares (processo, fatia de páginas), como os gerados pelos escalonadores."""
+        global_ = self.substituicao == "global"
+        fator = self.__fator if global_ else None
+        acessos, falhas = self.acessos, self.falhas
+        acessos_janela, falhas_janela = self.__acessos_janela, self.__falhas_janela
+        janela = self.janela
+
+        for processo, paginas in fatias:
+            if global_:
+                falhas_fatia = self.politica.acessar_lote(map(processo.__add__, map(fator.__mul__, paginas)))
+            else:
+                falhas_fatia = self.politicas[processo].acessar_lote(paginas)
+            quantidade = len(paginas)
+            acessos[processo] += quantidade
+            falhas[processo] += falhas_fatia
+
+            acessos_janela[processo] += quantidade
+            falhas_janela[processo] += falhas_fatia
+            if acessos_janela[processo] >= janela:
+                self.__fechar_janela(processo)
+
+            self.__acessos_janela_sistema += quantidade
+            self.__falhas_janela_sistema += falhas_fatia
+            if self.__acessos_janela_sistema >= janela:
+                self.__fechar_janela_sistema()
+
+    def __fechar_janela(self, processo: int) -> None:
+        taxa = self.__falhas_janela[processo] / self.__acessos_janela[processo]
+        self.janelas[processo] += 1
+        if taxa > self.limiar_thrashing:
+            self.janelas_thrashing[processo] += 1
+            if self.ao_detectar_thrashing:
+                self.ao_detectar_thrashing(processo, self.acessos[processo], taxa)
+        self.__acessos_janela[processo] = 0
+        self.__falhas_janela[processo] = 0
+
+    def __fechar_janela_sistema(self) -> None:
+        taxa = self.__falhas_janela_sistema / self.__acessos_janela_sistema
+        self.janelas_sistema += 1
+        if taxa > self.limiar_thrashing:
+            self.janelas_thrashing_sistema += 1
+            if self.ao_detectar_thrashing:
+                self.ao_detectar_thrashing(None, sum(self.acessos), taxa)
+        self.__acessos_janela_sistema = 0
+        self.__falhas_janela_sistema = 0
+
+    def processo_em_thrashing(self, processo: int) -> bool:
+        """Processo com a maioria das janelas em thrashing."""
+        return self.janelas_thrashing[processo] * 2 > self.janelas[processo]
+
+    def resultados(self) -> dict:
+        """Métricas por processo e do sistema. As janelas incompletas ao fim da simulação não são avaliadas."""
+        processos = [
+            {
+                "processo": processo,
+                "acessos": self.acessos[processo],
+                "falhas": self.falhas[processo],
+                "taxa": self.falhas[processo] / self.acessos[processo] if self.acessos[processo] else 0.0,
+                "cota": self.cotas[processo] if self.cotas else None,
+                "janelas": self.janelas[processo],
+                "janelas_thrashing": self.janelas_thrashing[processo],
+                "thrashing": self.processo_em_thrashing(processo),
+            }
+            for processo in range(self.num_processos)
+        ]
+        acessos = sum(self.acessos)
+        falhas = sum(self.falhas)
+        return {
+            "processos": processos,
+            "acessos": acessos,
+            "falhas": falhas,
+            "taxa": falhas / acessos if acessos else 0.0,
+            "janelas": self.janelas_sistema,
+            "janelas_thrashing": self.janelas_thrashing_sistema,
+            "processos_em_thrashing": sum(processo["thrashing"] for processo in processos),
+        }
+
+
+def main(argv=None) -> None:
+    """Simula processos sintéticos dividindo a memória e imprime a taxa de falhas do sistema e dos processos."""
+    parser = argparse.ArgumentParser(description="Simulação de vários processos dividindo a memória física.")
+    parser.add_argument("algoritmo", choices=list(POLITICAS))
+    parser.add_argument("--quadros", type=int, required=True, help="quadros na memória física")
+    parser.add_argument("--processos", type=int, required=True, help="número de processos")
+    parser.add_argument("--paginas", type=int, required=True, help="páginas endereçáveis de cada processo")
+    parser.add_argument("--acessos", type=int, default=100_000, help="referências de cada processo")
+    parser.add_argument("--sequencia", default="sequencia_localizada",
+                        choices=["sequencia_aleatoria", "sequencia_localizada", "sequencia_linear"])
+    parser.add_argument("--substituicao", default="global", choices=["global", "local"])
+    parser.add_argument("--quantum", type=int, default=1000, help="referências por fatia de cada processo")
+    parser.add_argument("--janela", type=int, default=10_000, help="referências por janela de detecção de thrashing")
+    parser.add_argument("--limiar", type=float, default=0.5, help="taxa de falhas (0 a 1) que caracteriza thrashing")
+    args = parser.parse_args(argv)
+
+    simulacao = Multiprogramacao(args.quadros, args.processos, args.algoritmo, args.substituicao,
+                                 janela=args.janela, limiar_thrashing=args.limiar)
+    fluxos = fluxos_sinteticos(args.processos, args.paginas, args.acessos, args.sequencia)
+    simulacao.executar(escalonar_por_fatias(fluxos, args.quantum))
+
+    resultados = simulacao.resultados()
+    print(f"{resultados['acessos']:,} referências, {resultados['falhas']:,} falhas ({resultados['taxa']:.4%})")
+    print(f"Janelas em thrashing: {resultados['janelas_thrashing']} de {resultados['janelas']}; "
+          f"processos em thrashing: {resultados['processos_em_thrashing']} de {args.processos}")
+    for processo in resultados["processos"]:
+        print(f"{processo['processo']}\t{processo['acessos']}\t{processo['falhas']}\t{processo['taxa']:.4f}"
+              f"\t{'thrashing' if processo['thrashing'] else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,992 @@
+import argparse
+import sys
+from collections import deque, OrderedDict
+from itertools import islice, starmap, repeat, chain
+
+from estruturas import (IndiceContadores, ConjuntoIndexado, coluna_de_zeros, tipo_para_bits, BitsEmLote,
+                        InteirosEmLote, FracoesEmLote)
+
+
+# POLÍTICAS DE SUBSTITUIÇÃO INCREMENTAIS
+# Cada política é um objeto com estado que recebe uma referência por vez (acessar) ou em lotes (acessar_lote),
+# permitindo simular sequências ao vivo (entrada padrão, sockets) e acompanhar a taxa de falhas ao longo do tempo.
+# As regras de cada política são as mesmas dos métodos de AlocadorDePaginas, com os mesmos resultados para a mesma
+# sequência e semente; o estado ocupa memória proporcional ao número de quadros, exceto no NFU, que guarda o contador
+# de toda página já referenciada (O(páginas distintas), como no método original).
+# Traços compactados em repetições (pares página, repetições; traco.compactar_repeticoes) são consumidos por
+# acessar_compactado. Cada política declara em repeticoes_exatas se o resultado é o mesmo da sequência expandida.
+
+class Politica:
+    """Base das políticas incrementais: conta acessos e falhas e, se janela > 0, chama ao_fechar_janela(acessos, taxa)
+    a cada janela de referências, com a taxa de falhas (0 a 1) da janela."""
+
+    # Referências repetidas seguidas não mudam o estado após as primeiras referencias_relevantes
+    # (e só a primeira pode falhar); políticas com efeitos a cada acesso sobrescrevem _repetir
+    referencias_relevantes = 1
+    repeticoes_exatas = True  # _repetir produz o mesmo resultado que as referências uma a uma
+
+    def __init__(self, num_quadros: int, janela: int = 0, ao_fechar_janela=None) -> None:
+        self.num_quadros = num_quadros
+        self.janela = janela
+        self.ao_fechar_janela = ao_fechar_janela
+        self.acessos = 0
+        self.falhas = 0
+        self.__falhas_janela = 0
+        self.__restantes_janela = janela
+
+    def _referenciar(self, pagina: int) -> bool:
+        """Processa uma referência, retornando True se houve falha de página."""
+        raise NotImplementedError
+
+    def contem(self, pagina: int) -> bool:
+        """Indica se a página está carregada na memória."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        """Número de páginas carregadas na memória."""
+        raise NotImplementedError
+
+    def redimensionar(self, num_quadros: int) -> None:
+        """Muda o número de quadros da política já aquecida (checkpoint.bifurcar). Se diminuir, as subclasses removem
+        páginas pela regra da própria política até caberem nos novos quadros, sem contar acessos nem falhas."""
+        if num_quadros < 1:
+            raise ValueError("O número de quadros deve ser positivo")
+        self.num_quadros = num_quadros
+
+    def carregar(self, pagina: int) -> bool:
+        """Carrega uma página sem que ela seja referenciada pelo processo (pré-busca), sem contar acesso nem falha.
+        Retorna False se a página já estava carregada."""
+        if self.contem(pagina):
+            return False
+        self._carregar(pagina)
+        return True
+
+    def _carregar(self, pagina: int) -> None:
+        """Por padrão, a página pré-buscada entra na memória como se tivesse sido referenciada."""
+        self._referenciar(pagina)
+
+    def acessar(self, pagina: int) -> bool:
+        """Referencia uma página, retornando True se houve falha de página."""
+        falha = self._referenciar(pagina)
+        self.acessos += 1
+        self.falhas += falha
+        if self.janela:
+            self.__falhas_janela += falha
+            self.__restantes_janela -= 1
+            if self.__restantes_janela == 0:
+                self.__fechar_janela()
+        return falha
+
+    def acessar_lote(self, paginas) -> int:
+        """Referencia uma sequência de páginas, retornando o número de falhas do lote.
+        Com janela, o lote é dividido nos limites das janelas, e cada trecho passa pelo mesmo laço."""
+        if not self.janela:
+            return self.__referenciar_trecho(paginas)[0]
+
+        paginas = iter(paginas)
+        falhas = 0
+        while True:
+            falhas_trecho, acessos = self.__referenciar_trecho(islice(paginas, self.__restantes_janela))
+            falhas += falhas_trecho
+            self.__falhas_janela += falhas_trecho
+            self.__restantes_janela -= acessos
+            if self.__restantes_janela:
+                return falhas
+            self.__fechar_janela()
+
+    def __referenciar_trecho(self, paginas) -> tuple:
+        """Referencia as páginas sem verificar janelas, retornando (falhas, acessos)."""
+        referenciar = self._referenciar
+        falhas = 0
+        acessos = 0
+        for pagina in paginas:
+            falhas += referenciar(pagina)
+            acessos += 1
+        self.acessos += acessos
+        self.falhas += falhas
+        return falhas, acessos
+
+    def __getstate__(self) -> dict:
+        # A função chamada a cada janela não faz parte do estado salvo (checkpoint.py); deve ser atribuída de novo
+        return {**self.__dict__, "ao_fechar_janela": None}
+
+    def _repetir(self, pagina: int, repeticoes: int) -> int:
+        """Processa repeticoes referências seguidas à mesma página, retornando o número de falhas."""
+        falhas = 0
+        for _ in range(min(repeticoes, self.referencias_relevantes)):
+            falhas += self._referenciar(pagina)
+        return falhas
+
+    def acessar_compactado(self, pares) -> int:
+        """Referencia uma sequência compactada de pares (página, repetições), retornando o número de falhas do lote."""
+        if self.janela:
+            return self.acessar_lote(chain.from_iterable(starmap(repeat, pares)))
+
+        repetir = self._repetir
+        falhas = 0
+        acessos = 0
+        for pagina, repeticoes in pares:
+            falhas += repetir(pagina, repeticoes)
+            acessos += repeticoes
+        self.acessos += acessos
+        self.falhas += falhas
+        return falhas
+
+    @property
+    def taxa_falhas(self) -> float:
+        return self.falhas / self.acessos if self.acessos else 0.0
+
+    def __fechar_janela(self) -> None:
+        if self.ao_fechar_janela:
+            self.ao_fechar_janela(self.acessos, self.__falhas_janela / self.janela)
+        self.__falhas_janela = 0
+        self.__restantes_janela = self.janela
+
+
+class Fifo(Politica):
+    """Fila simples: a página carregada há mais tempo sai para entrar uma nova."""
+
+    def __init__(self, num_quadros: int, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.fila = deque()
+        self.carregadas = set()
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.carregadas
+
+    def __len__(self) -> int:
+        return len(self.fila)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        while len(self.fila) > num_quadros:
+            self.carregadas.discard(self.fila.popleft())
+
+    def _referenciar(self, pagina: int) -> bool:
+        if pagina in self.carregadas:
+            return False
+        if len(self.fila) >= self.num_quadros:
+            self.carregadas.discard(self.fila.popleft())
+        self.fila.append(pagina)
+        self.carregadas.add(pagina)
+        return True
+
+
+class SegundaChance(Politica):
+    """Fila com segunda chance: páginas com bit_R = 1 voltam ao final da fila com bit_R = 0 em vez de sair."""
+
+    def __init__(self, num_quadros: int, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.paginas = []  # Página carregada em cada quadro
+        self.bits_R = bytearray(num_quadros)  # Bit de referência de cada quadro
+        self.indice = {}  # Quadro ocupado por cada página carregada
+        self.fila = deque()  # Ordem de chegada dos quadros
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.indice
+
+    def __len__(self) -> int:
+        return len(self.paginas)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        fila, bits_R = self.fila, self.bits_R
+        while len(fila) > num_quadros:
+            quadro = fila.popleft()
+            if bits_R[quadro]:
+                bits_R[quadro] = 0
+                fila.append(quadro)
+            else:
+                del self.indice[self.paginas[quadro]]
+
+        # Renumera os quadros restantes na ordem da fila
+        self.paginas = [self.paginas[quadro] for quadro in fila]
+        self.bits_R = bytearray(num_quadros)
+        self.bits_R[:len(fila)] = bytes(bits_R[quadro] for quadro in fila)
+        self.indice = {pagina: quadro for quadro, pagina in enumerate(self.paginas)}
+        self.fila = deque(range(len(self.paginas)))
+
+    def _referenciar(self, pagina: int) -> bool:
+        quadro = self.indice.get(pagina)
+        if quadro is not None:
+            self.bits_R[quadro] = 1
+            return False
+
+        if len(self.paginas) < self.num_quadros:
+            quadro = len(self.paginas)
+            self.paginas.append(pagina)
+        else:
+            while True:
+                quadro = self.fila.popleft()
+                if self.bits_R[quadro]:
+                    self.bits_R[quadro] = 0
+                    self.fila.append(quadro)
+                else:
+                    del self.indice[self.paginas[quadro]]
+                    self.paginas[quadro] = pagina
+                    break
+
+        self.indice[pagina] = quadro
+        self.bits_R[quadro] = 1
+        self.fila.append(quadro)
+        return True
+
+
+class Relogio(Politica):
+    """Segunda chance com fila circular: um ponteiro percorre os quadros zerando bits_R até achar uma vítima."""
+
+    def __init__(self, num_quadros: int, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.relogio = []  # Página carregada em cada quadro
+        self.bits_R = bytearray(num_quadros)  # Bit de referência de cada quadro
+        self.indice = {}  # Quadro ocupado por cada página carregada
+        self.ponteiro = 0
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.indice
+
+    def __len__(self) -> int:
+        return len(self.relogio)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        # Percorre os quadros a partir do ponteiro, com o mesmo giro de uma falha, até sobrarem num_quadros páginas
+        ponteiro = self.ponteiro
+        quadros = deque(zip(self.relogio[ponteiro:] + self.relogio[:ponteiro],
+                            self.bits_R[ponteiro:len(self.relogio)] + self.bits_R[:ponteiro]))
+        while len(quadros) > num_quadros:
+            pagina, bit_R = quadros.popleft()
+            if bit_R:
+                quadros.append((pagina, 0))
+            else:
+                del self.indice[pagina]
+
+        # Renumera os quadros com o ponteiro no quadro 0; quadros novos ficam logo antes dele
+        self.relogio = [pagina for pagina, _ in quadros]
+        self.bits_R = bytearray(num_quadros)
+        self.bits_R[:len(quadros)] = bytes(bit_R for _, bit_R in quadros)
+        self.indice = {pagina: quadro for quadro, pagina in enumerate(self.relogio)}
+        self.ponteiro = 0
+
+    def _referenciar(self, pagina: int) -> bool:
+        quadro = self.indice.get(pagina)
+        if quadro is not None:
+            self.bits_R[quadro] = 1
+            return False
+
+        if len(self.relogio) < self.num_quadros:
+            self.indice[pagina] = len(self.relogio)
+            self.bits_R[len(self.relogio)] = 1
+            self.relogio.append(pagina)
+            return True
+
+        bits_R = self.bits_R
+        ponteiro = self.ponteiro
+        while bits_R[ponteiro]:
+            bits_R[ponteiro] = 0
+            ponteiro = (ponteiro + 1) % self.num_quadros
+
+        del self.indice[self.relogio[ponteiro]]
+        self.relogio[ponteiro] = pagina
+        self.indice[pagina] = ponteiro
+        bits_R[ponteiro] = 1
+        self.ponteiro = (ponteiro + 1) % self.num_quadros
+        return True
+
+
+class Lru(Politica):
+    """Menos usado recentemente: a página referenciada há mais tempo sai para entrar uma nova."""
+
+    def __init__(self, num_quadros: int, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.paginas_carregadas = OrderedDict()
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.paginas_carregadas
+
+    def __len__(self) -> int:
+        return len(self.paginas_carregadas)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        while len(self.paginas_carregadas) > num_quadros:
+            self.paginas_carregadas.popitem(last=False)
+
+    def _referenciar(self, pagina: int) -> bool:
+        if pagina in self.paginas_carregadas:
+            self.paginas_carregadas.move_to_end(pagina)
+            return False
+        if len(self.paginas_carregadas) >= self.num_quadros:
+            self.paginas_carregadas.popitem(last=False)
+        self.paginas_carregadas[pagina] = None
+        return True
+
+
+class PoliticaComInterrupcoes(Politica):
+    """Base das políticas com interrupções de clock simuladas (NRU, NFU e envelhecimento): a cada número aleatório de
+    referências (sorteado em faixa_aleatoria) ocorre uma interrupção, e as vítimas são sorteadas com a semente.
+    As subclasses decrementam contador_clock a cada referência e chamam _interrupcao quando ele chega a zero.
+    As vítimas usam frações sorteadas em lote e as interrupções movem as páginas referenciadas em lote
+    (IndiceContadores.mover_varios, ConjuntoIndexado.adicionar_varias), mas estas políticas não chegam a 1 milhão de
+    referências/s: com 1024 quadros ficam entre 0,4 e 0,7 milhão/s (o envelhecimento é o mais lento), tanto em
+    acessar_lote quanto nos métodos de AlocadorDePaginas. O custo está na manutenção das classes/índice a cada
+    referência (o NRU sorteia bit_M e troca a página de classe a cada acerto) e em mover cada página referenciada
+    nas interrupções, e não cai com a taxa de falhas."""
+
+    def __init__(self, num_quadros: int, semente: int = 556677, faixa_aleatoria=(5, 25), **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.vitimas = FracoesEmLote(f"{semente}:vitimas")
+        self.faixa_aleatoria = faixa_aleatoria
+        self.intervalos = InteirosEmLote(f"{semente}:interrupcoes", *faixa_aleatoria)
+        self.contador_clock = self.intervalos.proximo()
+
+    def _interrupcao(self) -> None:
+        """Processa a interrupção de clock e sorteia o intervalo até a próxima."""
+        raise NotImplementedError
+
+    def _acertos_repetidos(self, pagina: int, passos: int) -> None:
+        """Aplica passos acertos seguidos à página carregada, sem interrupção entre eles."""
+        raise NotImplementedError
+
+    def _carregar(self, pagina: int) -> None:
+        # Carregar não é uma referência: compensa o avanço do clock feito por _referenciar
+        self.contador_clock += 1
+        self._referenciar(pagina)
+
+    def _repetir(self, pagina: int, repeticoes: int) -> int:
+        falha = self._referenciar(pagina)
+        restantes = repeticoes - 1
+        while restantes:
+            # Acertos seguidos até a próxima interrupção de clock
+            passos = min(restantes, self.contador_clock)
+            self._acertos_repetidos(pagina, passos)
+            self.contador_clock -= passos
+            restantes -= passos
+            if self.contador_clock == 0:
+                self._interrupcao()
+        return falha
+
+
+class Nru(PoliticaComInterrupcoes):
+    """Não usado recentemente: remove uma página sorteada da menor classe (bit_R * 2 + bit_M) não vazia.
+    Os bits_R são zerados a cada "reset", que ocorre após um número aleatório de referências."""
+
+    def __init__(self, num_quadros: int, semente: int = 556677, faixa_aleatoria=(5, 25), **opcoes) -> None:
+        super().__init__(num_quadros, semente, faixa_aleatoria, **opcoes)
+        self.bits = {}  # Páginas carregadas -> [bit_R, bit_M]
+        self.classes = [ConjuntoIndexado() for _ in range(4)]
+        self.bits_M = BitsEmLote(f"{semente}:bits_M")
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.bits
+
+    def __len__(self) -> int:
+        return len(self.bits)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        while len(self.bits) > num_quadros:
+            self.__remover_vitima()
+
+    def __remover_vitima(self) -> None:
+        for classe in self.classes:
+            if classe:
+                pag_a_remover = classe.sortear(self.vitimas.proximo)
+                classe.remover(pag_a_remover)
+                break
+        del self.bits[pag_a_remover]
+
+    def _referenciar(self, pagina: int) -> bool:
+        bits = self.bits.get(pagina)
+        if bits is not None:
+            classe_anterior = bits[0] * 2 + bits[1]
+            bits[0] = 1
+            bits[1] = self.bits_M.proximo()
+            if 2 + bits[1] != classe_anterior:
+                self.classes[classe_anterior].remover(pagina)
+                self.classes[2 + bits[1]].adicionar(pagina)
+            falha = False
+        else:
+            if len(self.bits) < self.num_quadros:
+                bits = self.bits[pagina] = [1, 0]
+            else:
+                self.__remover_vitima()
+                bits = self.bits[pagina] = [1, self.bits_M.proximo()]
+            self.classes[2 + bits[1]].adicionar(pagina)
+            falha = True
+
+        self.contador_clock -= 1
+        if self.contador_clock == 0:
+            self._interrupcao()
+        return falha
+
+    def _interrupcao(self) -> None:
+        # "Reset": zera os bits_R (as classes 2 e 3 passam a 0 e 1)
+        for classe_R, classe_sem_R in ((self.classes[2], self.classes[0]), (self.classes[3], self.classes[1])):
+            paginas = classe_R.esvaziar()
+            for pag in paginas:
+                self.bits[pag][0] = 0
+            classe_sem_R.adicionar_varias(paginas)
+        self.contador_clock = self.intervalos.proximo()
+
+    # Os acertos repetidos sorteiam um bit_M cada um; em lote, a página muda de classe uma vez por trecho entre "resets"
+    # (com o último bit sorteado), o que altera a ordem interna das classes e, portanto, os sorteios de vítimas
+    repeticoes_exatas = False
+
+    def _acertos_repetidos(self, pagina: int, passos: int) -> None:
+        # Consome os bits_M sorteados, ficando com o último
+        bits = self.bits[pagina]
+        classe_anterior = bits[0] * 2 + bits[1]
+        bits[0] = 1
+        bits[1] = self.bits_M.avancar(passos)
+        if 2 + bits[1] != classe_anterior:
+            self.classes[classe_anterior].remover(pagina)
+            self.classes[2 + bits[1]].adicionar(pagina)
+
+
+class NfuContador(PoliticaComInterrupcoes):
+    """Não usado frequentemente: cada interrupção de clock soma o bit_R ao contador da página,
+    e em caso de falha sai uma página sorteada entre as de menor contador.
+    Os contadores das páginas que saem da memória são mantidos (uma página que volta continua de onde parou), então a
+    memória é O(páginas distintas referenciadas), e não O(quadros)."""
+
+    def __init__(self, num_quadros: int, semente: int = 556677, faixa_aleatoria=(5, 25), **opcoes) -> None:
+        super().__init__(num_quadros, semente, faixa_aleatoria, **opcoes)
+        self.contadores = {}  # Contador de toda página já referenciada (mantido ao sair da memória)
+        self.carregadas = set()
+        self.referenciadas = set()  # Páginas com bit_R = 1 (sempre carregadas)
+        self.indice = IndiceContadores()
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.carregadas
+
+    def __len__(self) -> int:
+        return len(self.carregadas)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        while len(self.carregadas) > num_quadros:
+            self.__remover_vitima()
+
+    def __remover_vitima(self) -> None:
+        pag_a_remover = self.indice.escolher_menor(self.vitimas.proximo)
+        self.indice.remover(pag_a_remover, self.contadores[pag_a_remover])
+        self.carregadas.remove(pag_a_remover)
+        self.referenciadas.discard(pag_a_remover)
+
+    def _referenciar(self, pagina: int) -> bool:
+        if pagina in self.carregadas:
+            self.referenciadas.add(pagina)
+            falha = False
+        else:
+            if len(self.carregadas) >= self.num_quadros:
+                self.__remover_vitima()
+            self.carregadas.add(pagina)
+            self.indice.adicionar(pagina, self.contadores.setdefault(pagina, 0))
+            falha = True
+
+        self.contador_clock -= 1
+        if self.contador_clock == 0:
+            self._interrupcao()
+        return falha
+
+    def _interrupcao(self) -> None:
+        contadores = self.contadores
+        movimentos = [(pag, contadores[pag], contadores[pag] + 1) for pag in self.referenciadas]
+        self.indice.mover_varios(movimentos)
+        contadores.update((pag, novo) for pag, _, novo in movimentos)
+        self.referenciadas.clear()
+        self.contador_clock = self.intervalos.proximo()
+
+    def _acertos_repetidos(self, pagina: int, passos: int) -> None:
+        self.referenciadas.add(pagina)
+
+
+class Envelhecimento(PoliticaComInterrupcoes):
+    """NFU com envelhecimento: a cada interrupção de clock os contadores são deslocados para a direita
+    e o bit_R entra no bit mais significativo (contador de bits_contador bits), aplicado de forma preguiçosa por época."""
+
+    def __init__(self, num_quadros: int, semente: int = 556677, faixa_aleatoria=(5, 25), bits_contador: int = 4,
+                 **opcoes) -> None:
+        super().__init__(num_quadros, semente, faixa_aleatoria, **opcoes)
+        tipo_para_bits(bits_contador)  # Valida a largura
+        self.bit_mais_significativo = 1 << (bits_contador - 1)
+        self.historico = {}  # Página -> (contador, época em que foi gravado)
+        self.carregadas = set()
+        self.referenciadas = set()  # Páginas com bit_R = 1 (sempre carregadas)
+        self.indice = IndiceContadores()
+        self.epoca = 0
+
+    def contador(self, pagina: int) -> int:
+        """Valor atual do contador da página, envelhecido pelas interrupções desde que foi gravado."""
+        contador, epoca = self.historico.get(pagina, (0, self.epoca))
+        return contador >> (self.epoca - epoca)
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.carregadas
+
+    def __len__(self) -> int:
+        return len(self.carregadas)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        while len(self.carregadas) > num_quadros:
+            self.__remover_vitima()
+
+    def __remover_vitima(self) -> None:
+        pag_a_remover = self.indice.escolher_menor(self.vitimas.proximo)
+        self.indice.remover(pag_a_remover, self.contador(pag_a_remover))
+        self.carregadas.remove(pag_a_remover)
+        self.referenciadas.discard(pag_a_remover)
+
+    def _referenciar(self, pagina: int) -> bool:
+        if pagina in self.carregadas:
+            self.referenciadas.add(pagina)
+            falha = False
+        else:
+            if len(self.carregadas) >= self.num_quadros:
+                self.__remover_vitima()
+            self.carregadas.add(pagina)
+            self.indice.adicionar(pagina, self.contador(pagina))
+            falha = True
+
+        self.contador_clock -= 1
+        if self.contador_clock == 0:
+            self._interrupcao()
+        return falha
+
+    def _interrupcao(self) -> None:
+        self.indice.remapear(lambda contador: contador >> 1)
+        historico, epoca, bit_mais_significativo = self.historico, self.epoca, self.bit_mais_significativo
+        movimentos = []
+        for pag in self.referenciadas:
+            # Mesmo que self.contador(pag) >> 1, sem a chamada por página
+            contador, gravado = historico.get(pag, (0, epoca))
+            deslocado = contador >> (epoca + 1 - gravado)
+            movimentos.append((pag, deslocado, deslocado | bit_mais_significativo))
+            historico[pag] = (deslocado | bit_mais_significativo, epoca + 1)
+        self.indice.mover_varios(movimentos)
+        self.referenciadas.clear()
+        self.epoca += 1
+
+        # Descarta o histórico de páginas fora da memória cujo contador já chegou a zero
+        if len(self.historico) > 4 * self.num_quadros:
+            self.historico = {pag: (contador, epoca) for pag, (contador, epoca) in self.historico.items()
+                              if pag in self.carregadas or contador >> (self.epoca - epoca)}
+        self.contador_clock = self.intervalos.proximo()
+
+    def _acertos_repetidos(self, pagina: int, passos: int) -> None:
+        self.referenciadas.add(pagina)
+
+
+class Arc(Politica):
+    """Substituição adaptativa (ARC): listas LRU T1 (referenciadas uma vez) e T2 (mais de uma vez), com fantasmas das
+    páginas removidas em B1 e B2; falhas nos fantasmas ajustam o tamanho alvo de T1."""
+
+    referencias_relevantes = 2  # A segunda referência leva a página de T1 para T2
+
+    def __init__(self, num_quadros: int, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.t1, self.t2, self.b1, self.b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+        self.alvo_t1 = 0
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.t1 or pagina in self.t2
+
+    def __len__(self) -> int:
+        return len(self.t1) + len(self.t2)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        # As páginas removidas viram fantasmas, e os fantasmas são cortados até L1 ter no máximo c páginas e L1 + L2, 2c
+        self.alvo_t1 = min(self.alvo_t1, num_quadros)
+        while len(self.t1) + len(self.t2) > num_quadros:
+            self.__substituir(None)
+        while len(self.t1) + len(self.b1) > num_quadros:
+            self.b1.popitem(last=False)
+        while len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * num_quadros:
+            self.b2.popitem(last=False)
+
+    def __substituir(self, pagina: int) -> None:
+        t1 = self.t1
+        if t1 and (len(t1) > self.alvo_t1 or (pagina in self.b2 and len(t1) == self.alvo_t1)):
+            self.b1[t1.popitem(last=False)[0]] = None
+        else:
+            self.b2[self.t2.popitem(last=False)[0]] = None
+
+    def _referenciar(self, pagina: int) -> bool:
+        t1, t2, b1, b2 = self.t1, self.t2, self.b1, self.b2
+        if pagina in t2:
+            t2.move_to_end(pagina)
+            return False
+        if pagina in t1:
+            del t1[pagina]
+            t2[pagina] = None
+            return False
+
+        if pagina in b1:
+            self.alvo_t1 = min(self.num_quadros, self.alvo_t1 + max(len(b2) // len(b1), 1))
+            self.__substituir(pagina)
+            del b1[pagina]
+            t2[pagina] = None
+        elif pagina in b2:
+            self.alvo_t1 = max(0, self.alvo_t1 - max(len(b1) // len(b2), 1))
+            self.__substituir(pagina)
+            del b2[pagina]
+            t2[pagina] = None
+        else:
+            tamanho_l1 = len(t1) + len(b1)
+            if tamanho_l1 == self.num_quadros:
+                if len(t1) < self.num_quadros:
+                    b1.popitem(last=False)
+                    self.__substituir(pagina)
+                else:
+                    t1.popitem(last=False)
+            elif tamanho_l1 + len(t2) + len(b2) >= self.num_quadros:
+                if tamanho_l1 + len(t2) + len(b2) == 2 * self.num_quadros:
+                    b2.popitem(last=False)
+                self.__substituir(pagina)
+            t1[pagina] = None
+        return True
+
+
+class DoisQ(Politica):
+    """2Q: páginas novas entram na fila FIFO A1in; ao sair dela ficam como fantasmas em A1out, e só uma página
+    referenciada de novo enquanto fantasma entra na lista LRU principal (Am)."""
+
+    def __init__(self, num_quadros: int, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.a1_entrada, self.a1_saida, self.principal = OrderedDict(), OrderedDict(), OrderedDict()
+        self.max_entrada = max(1, num_quadros // 4)
+        self.max_saida = max(1, num_quadros // 2)
+        self.promocoes = 0  # Páginas promovidas de A1out para Am
+
+    def contem(self, pagina: int) -> bool:
+        return pagina in self.principal or pagina in self.a1_entrada
+
+    def __len__(self) -> int:
+        return len(self.a1_entrada) + len(self.principal)
+
+    def redimensionar(self, num_quadros: int) -> None:
+        super().redimensionar(num_quadros)
+        self.max_entrada = max(1, num_quadros // 4)
+        self.max_saida = max(1, num_quadros // 2)
+        while len(self.a1_entrada) + len(self.principal) > num_quadros:
+            self.__remover_vitima()
+        while len(self.a1_saida) > self.max_saida:
+            self.a1_saida.popitem(last=False)
+
+    def __remover_vitima(self) -> None:
+        if len(self.a1_entrada) > self.max_entrada or not self.principal:
+            self.a1_saida[self.a1_entrada.popitem(last=False)[0]] = None
+            if len(self.a1_saida) > self.max_saida:
+                self.a1_saida.popitem(last=False)
+        else:
+            self.principal.popitem(last=False)
+
+    def _referenciar(self, pagina: int) -> bool:
+        if pagina in self.principal:
+            self.principal.move_to_end(pagina)
+            return False
+        if pagina in self.a1_entrada:
+            return False
+
+        if len(self.a1_entrada) + len(self.principal) >= self.num_quadros:
+            self.__remover_vitima()
+
+        if pagina in self.a1_saida:
+            del self.a1_saida[pagina]
+            self.principal[pagina] = None
+            self.promocoes += 1
+        else:
+            self.a1_entrada[pagina] = None
+        return True
+
+
+class Lirs(Politica):
+    """LIRS: páginas LIR (menor distância entre referências) ocupam quase todos os quadros, e as HIR disputam 1% deles
+    numa fila FIFO. A pilha S guarda a recência das LIR e das HIR recentes; uma HIR referenciada de novo enquanto em S
+    passa a LIR, e a LIR mais antiga volta a HIR. S guarda no máximo max_nao_residentes páginas HIR fora da memória
+    (por padrão, o dobro dos quadros): acima disso, as que saíram da memória há mais tempo são descartadas."""
+
+    LIR, HIR_RESIDENTE, HIR_NAO_RESIDENTE = 0, 1, 2
+    referencias_relevantes = 2  # A segunda referência promove a página HIR recém-carregada a LIR
+
+    def __init__(self, num_quadros: int, max_nao_residentes: int | None = None, **opcoes) -> None:
+        super().__init__(num_quadros, **opcoes)
+        self.estados = {}  # Página -> estado (páginas em S ou na fila)
+        self.pilha = OrderedDict()  # S: topo (mais recente) no final
+        self.fila = OrderedDict()  # Q: páginas HIR residentes
+        self.nao_residentes = OrderedDict()  # Páginas HIR não residentes em S, na ordem em que saíram da memória
+        self.max_nao_residentes = 2 * num_quadros if max_nao_residentes is None else max_nao_residentes
+        self.max_lir = num_quadros - max(1, num_quadros // 100)
+        self.num_lir = 0
+        self.promocoes = 0  # Páginas HIR que passaram a LIR
+
+    def contem(self, pagina: int) -> bool:
+        estado = self.estados.get(pagina)
+        return estado is not None and estado != self.HIR_NAO_RESIDENTE
+
+    def __len__(self) -> int:
+        return self.num_lir + len(self.fila)
+
+    def __podar(self) -> None:
+        while self.pilha:
+            pagina = next(iter(self.pilha))
+            if self.estados[pagina] == self.LIR:
+                break
+            del self.pilha[pagina]
+            if self.estados[pagina] == self.HIR_NAO_RESIDENTE:
+                del self.estados[pagina]
+                del self.nao_residentes[pagina]
+
+    def __rebaixar_lir_mais_antiga(self) -> None:
+        pagina = self.pilha.popitem(last=False)[0]
+        self.estados[pagina] = self.HIR_RESIDENTE
+        self.fila[pagina] = None
+        self.__podar()
+
+    def __remover_residente(self) -> None:
+        removida = self.fila.popitem(last=False)[0]
+        if removida in self.pilha:
+            self.estados[removida] = self.HIR_NAO_RESIDENTE
+            self.nao_residentes[removida] = None
+            self.__limitar_nao_residentes()
+        else:
+            del self.estados[removida]
+
+    def __limitar_nao_residentes(self) -> None:
+        # Limita S: descarta as HIR não residentes mais antigas (o fundo de S é sempre uma LIR)
+        while len(self.nao_residentes) > self.max_nao_residentes:
+            descartada = self.nao_residentes.popitem(last=False)[0]
+            del self.pilha[descartada]
+            del self.estados[descartada]
+
+    def redimensionar(self, num_quadros: int, max_nao_residentes: int | None = None) -> None:
+        """Como no construtor, max_nao_residentes é por padrão o dobro dos novos quadros. Se diminuir, as LIR mais
+        antigas passam a HIR até caberem em max_lir, e as HIR residentes saem na ordem da fila."""
+        super().redimensionar(num_quadros)
+        self.max_nao_residentes = 2 * num_quadros if max_nao_residentes is None else max_nao_residentes
+        self.max_lir = num_quadros - max(1, num_quadros // 100)
+        while self.num_lir > self.max_lir:
+            self.num_lir -= 1
+            self.__rebaixar_lir_mais_antiga()
+        while self.num_lir + len(self.fila) > num_quadros:
+            self.__remover_residente()
+        self.__limitar_nao_residentes()
+
+    def _referenciar(self, pagina: int) -> bool:
+        estados, pilha, fila = self.estados, self.pilha, self.fila
+        estado = estados.get(pagina)
+
+        if estado == self.LIR:
+            no_fundo = next(iter(pilha)) == pagina
+            pilha.move_to_end(pagina)
+            if no_fundo:
+                self.__podar()
+            return False
+
+        if estado == self.HIR_RESIDENTE:
+            if pagina in pilha and self.max_lir:
+                estados[pagina] = self.LIR
+                del fila[pagina]
+                pilha.move_to_end(pagina)
+                self.promocoes += 1
+                self.__rebaixar_lir_mais_antiga()
+            else:
+                pilha[pagina] = None
+                pilha.move_to_end(pagina)
+                fila.move_to_end(pagina)
+            return False
+
+        if estado == self.HIR_NAO_RESIDENTE:
+            del self.nao_residentes[pagina]
+
+        if self.num_lir + len(fila) >= self.num_quadros:
+            self.__remover_residente()
+
+        if self.num_lir < self.max_lir:
+            # Uma HIR não residente (após redimensionar para mais quadros) já está em S e vai para o topo
+            estados[pagina] = self.LIR
+            self.num_lir += 1
+            pilha[pagina] = None
+            pilha.move_to_end(pagina)
+        elif estado == self.HIR_NAO_RESIDENTE and self.max_lir:
+            estados[pagina] = self.LIR
+            pilha.move_to_end(pagina)
+            self.promocoes += 1
+            self.__rebaixar_lir_mais_antiga()
+        else:
+            estados[pagina] = self.HIR_RESIDENTE
+            pilha[pagina] = None
+            pilha.move_to_end(pagina)
+            fila[pagina] = None
+        return True
+
+
+# SIMULAÇÃO DE VÁRIOS NÚMEROS DE QUADROS DE UMA VEZ
+# Cada página carregada guarda a máscara de bits das configurações (números de quadros) que a têm em memória,
+# de modo que uma referência que acerta em todas elas custa uma única consulta; só as configurações com falha
+# atualizam suas filas, guardadas em arrays circulares. Os resultados são os mesmos de uma execução por configuração.
+# Compensa em varreduras com muitos números de quadros sobre traços com muitos acertos; com taxas de falhas altas,
+# cada falha custa mais que em uma execução por configuração, e o simulador fica mais lento que elas
+# (AlocadorDePaginas.multiplas_configuracoes testa o início do traço para escolher entre os dois).
+
+class FifoMultiplo:
+    """FIFO simulado para vários números de quadros em uma única passada."""
+
+    def __init__(self, lista_quadros) -> None:
+        self.lista_quadros = list(lista_quadros)
+        self.falhas = [0] * len(self.lista_quadros)
+        self.carregadas = {}  # Página -> máscara das configurações que a têm em memória
+        self.filas = [coluna_de_zeros("Q", quadros) for quadros in self.lista_quadros]
+        self.ocupados = [0] * len(self.lista_quadros)
+        self.ponteiros = [0] * len(self.lista_quadros)  # Posição da página mais antiga (próxima a sair) de cada fila
+
+    def acessar_lote(self, paginas) -> None:
+        carregadas = self.carregadas
+        lista_quadros, falhas, filas, ocupados, ponteiros = (self.lista_quadros, self.falhas, self.filas,
+                                                             self.ocupados, self.ponteiros)
+        todas = (1 << len(lista_quadros)) - 1
+
+        for pagina in paginas:
+            mascara = carregadas.get(pagina, 0)
+            if mascara == todas:
+                continue
+
+            # Percorre as configurações em que a página não está carregada
+            faltantes = todas ^ mascara
+            while faltantes:
+                bit = faltantes & -faltantes
+                faltantes ^= bit
+                k = bit.bit_length() - 1
+                falhas[k] += 1
+                fila = filas[k]
+                ponteiro = ponteiros[k]
+                if ocupados[k] < lista_quadros[k]:
+                    ocupados[k] += 1
+                else:
+                    vitima = fila[ponteiro]
+                    restante = carregadas[vitima] ^ bit
+                    if restante:
+                        carregadas[vitima] = restante
+                    else:
+                        del carregadas[vitima]
+                fila[ponteiro] = pagina
+                ponteiros[k] = (ponteiro + 1) % lista_quadros[k]
+            carregadas[pagina] = todas
+
+
+class RelogioMultiplo:
+    """Relógio simulado para vários números de quadros em uma única passada.
+    Cada página guarda o instante da sua última referência, e cada quadro de cada configuração o instante em que o
+    ponteiro zerou seu bit_R: o bit_R está ligado se a página foi referenciada depois disso. Assim um acerto atualiza
+    todas as configurações de uma vez, e o giro do ponteiro só lê a página e grava no array da configuração."""
+
+    def __init__(self, lista_quadros) -> None:
+        self.lista_quadros = list(lista_quadros)
+        self.falhas = [0] * len(self.lista_quadros)
+        self.carregadas = {}  # Página -> máscara das configurações que a têm em memória
+        self.ultimo_acesso = {}  # Página carregada -> instante da última referência
+        self.relogios = [coluna_de_zeros("Q", quadros) for quadros in self.lista_quadros]
+        self.limpezas = [coluna_de_zeros("Q", quadros) for quadros in self.lista_quadros]
+        self.ocupados = [0] * len(self.lista_quadros)
+        self.ponteiros = [0] * len(self.lista_quadros)
+        self.instante = 0
+
+    def acessar_lote(self, paginas) -> None:
+        carregadas, ultimo_acesso = self.carregadas, self.ultimo_acesso
+        lista_quadros, falhas, relogios, limpezas, ocupados, ponteiros = (
+            self.lista_quadros, self.falhas, self.relogios, self.limpezas, self.ocupados, self.ponteiros)
+        todas = (1 << len(lista_quadros)) - 1
+
+        instante = self.instante
+        for instante, pagina in enumerate(paginas, instante + 1):
+            mascara = carregadas.get(pagina, 0)
+            if mascara == todas:
+                ultimo_acesso[pagina] = instante
+                continue
+
+            faltantes = todas ^ mascara
+            while faltantes:
+                bit = faltantes & -faltantes
+                faltantes ^= bit
+                k = bit.bit_length() - 1
+                falhas[k] += 1
+                relogio = relogios[k]
+                if ocupados[k] < lista_quadros[k]:
+                    relogio[ocupados[k]] = pagina
+                    ocupados[k] += 1
+                    continue
+
+                # Gira o ponteiro zerando os bits_R desta configuração até achar uma vítima
+                quadros = lista_quadros[k]
+                limpeza = limpezas[k]
+                ponteiro = ponteiros[k]
+                while ultimo_acesso[relogio[ponteiro]] > limpeza[ponteiro]:
+                    limpeza[ponteiro] = instante
+                    ponteiro += 1
+                    if ponteiro == quadros:
+                        ponteiro = 0
+
+                vitima = relogio[ponteiro]
+                restante = carregadas[vitima] ^ bit
+                if restante:
+                    carregadas[vitima] = restante
+                else:
+                    del carregadas[vitima]
+                    del ultimo_acesso[vitima]
+                relogio[ponteiro] = pagina
+                limpeza[ponteiro] = 0  # A página entra com bit_R = 1
+                ponteiros[k] = ponteiro + 1 if ponteiro + 1 < quadros else 0
+            carregadas[pagina] = todas
+            ultimo_acesso[pagina] = instante
+        self.instante = instante
+
+
+# Simuladores de vários números de quadros em uma passada, pelo nome do método equivalente em AlocadorDePaginas
+POLITICAS_MULTIPLAS = {
+    "fifo": FifoMultiplo,
+    "relogio": RelogioMultiplo,
+}
+
+
+# Políticas disponíveis, pelo nome do método equivalente em AlocadorDePaginas
+POLITICAS = {
+    "fifo": Fifo,
+    "segunda_chance": SegundaChance,
+    "relogio": Relogio,
+    "nru": Nru,
+    "lru_lista": Lru,
+    "nfu_contador": NfuContador,
+    "envelhecimento": Envelhecimento,
+    "arc": Arc,
+    "dois_q": DoisQ,
+    "lirs": Lirs,
+}
+
+
+def ler_paginas(arquivo):
+    """Lê números de página (um ou mais por linha, em decimal) de um arquivo de texto, à medida que chegam."""
+    for linha in arquivo:
+        for campo in linha.split():
+            yield int(campo)
+
+
+def main(argv=None) -> None:
+    """Simula uma política sobre páginas lidas da entrada padrão, imprimindo a taxa de falhas de cada janela."""
+    parser = argparse.ArgumentParser(description="Simulação incremental de uma política sobre referências da entrada padrão.")
+    parser.add_argument("politica", choices=list(POLITICAS))
+    parser.add_argument("--quadros", type=int, required=True, help="quadros na memória")
+    parser.add_argument("--janela", type=int, default=1000, help="referências por janela de taxa de falhas")
+    args = parser.parse_args(argv)
+
+    def imprimir(acessos: int, taxa: float) -> None:
+        print(f"{acessos}\t{taxa:.4f}", flush=True)
+
+    politica = POLITICAS[args.politica](args.quadros, janela=args.janela, ao_fechar_janela=imprimir)
+    politica.acessar_lote(ler_paginas(sys.stdin))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# PRÉ-BUSCA (READAHEAD)
+# Um pré-buscador observa cada referência e indica páginas a carregar antes de serem pedidas. As páginas indicadas
+# que ainda não estão na memória são lidas no mesmo lote da falha que as motivou (ou em um lote próprio, quando o
+# gatilho é um acerto de pré-busca) e entram na política de substituição como qualquer outra página carregada.
+# Funciona com todas as políticas incrementais de politicas.py.
+
+class ReadaheadFixo:
+    """Readahead de janela fixa: uma falha na página p pré-busca p + 1 a p + janela; um acerto em página pré-buscada
+    estende a leitura até (página + janela), mantendo o fluxo sequencial à frente do processo."""
+
+    def __init__(self, janela: int = 8) -> None:
+        if janela < 1:
+            raise ValueError("A janela de readahead deve ter ao menos uma página")
+        self.janela = janela
+        self.limite = -1  # Última página já pré-buscada no fluxo atual
+
+    def observar(self, pagina: int, falha: bool, acerto_prefetch: bool):
+        """Recebe uma referência e retorna as páginas a pré-buscar (possivelmente já carregadas)."""
+        if falha:
+            self.limite = pagina + self.janela
+            return range(pagina + 1, self.limite + 1)
+        if acerto_prefetch and pagina + self.janela > self.limite:
+            inicio = max(self.limite, pagina) + 1
+            self.limite = pagina + self.janela
+            return range(inicio, self.limite + 1)
+        return ()
+
+
+class ReadaheadAdaptativo(ReadaheadFixo):
+    """Readahead de janela adaptativa: a janela dobra (até maximo) a cada falha sequencial ou acerto de pré-busca,
+    e volta ao valor inicial quando uma falha não continua o fluxo (acesso aleatório).
+    Com num_quadros, a janela fica limitada a 1/4 dos quadros: uma janela do tamanho da memória remove as páginas
+    pré-buscadas antes de serem referenciadas, e a pré-busca passa a causar falhas em vez de evitá-las."""
+
+    def __init__(self, inicial: int = 4, maximo: int = 64, num_quadros: int | None = None) -> None:
+        if num_quadros is not None:
+            maximo = min(maximo, max(1, num_quadros // 4))
+            inicial = min(inicial, maximo)
+        super().__init__(inicial)
+        self.inicial = inicial
+        self.maximo = maximo
+        self.ultima_pagina = None
+
+    def observar(self, pagina: int, falha: bool, acerto_prefetch: bool):
+        if falha:
+            sequencial = self.ultima_pagina is not None and pagina == self.ultima_pagina + 1
+            self.janela = min(self.janela * 2, self.maximo) if sequencial else self.inicial
+        elif acerto_prefetch:
+            self.janela = min(self.janela * 2, self.maximo)
+        self.ultima_pagina = pagina
+        return super().observar(pagina, falha, acerto_prefetch)
+
+
+class DeteccaoDePasso:
+    """Detecção de passo (stride): quando a diferença entre referências consecutivas se repete confirmacoes vezes,
+    pré-busca as próximas distancia páginas do padrão (p + passo, p + 2 * passo, ...) a cada falha ou acerto de pré-busca."""
+
+    def __init__(self, distancia: int = 4, confirmacoes: int = 2) -> None:
+        self.distancia = distancia
+        self.confirmacoes = confirmacoes
+        self.ultima_pagina = None
+        self.passo = 0
+        self.repeticoes = 0
+
+    def observar(self, pagina: int, falha: bool, acerto_prefetch: bool):
+        if self.ultima_pagina is not None:
+            passo = pagina - self.ultima_pagina
+            if passo == self.passo and passo != 0:
+                self.repeticoes += 1
+            else:
+                self.passo = passo
+                self.repeticoes = 1
+        self.ultima_pagina = pagina
+
+        # Um passo 0 (a mesma página repetida) não indica páginas a pré-buscar
+        if (falha or acerto_prefetch) and self.passo and self.repeticoes >= self.confirmacoes:
+            return range(pagina + self.passo, pagina + self.passo * (self.distancia + 1), self.passo)
+        return ()
+
+
+# Pré-buscadores disponíveis, pelo nome
+PREFETCHERS = {
+    "fixo": ReadaheadFixo,
+    "adaptativo": ReadaheadAdaptativo,
+    "passo": DeteccaoDePasso,
+}
+
+
+def simular(politica, paginas, prefetcher, max_paginas: int | None = None) -> dict:
+    """Simula a política com pré-busca sobre a sequência de páginas, retornando os contadores da pré-busca:
+    - acertos_prefetch: referências a páginas pré-buscadas ainda na memória (falhas evitadas);
+    - desperdicadas: páginas pré-buscadas removidas antes de serem referenciadas, ou nunca referenciadas;
+    - paginas_lidas: páginas carregadas pela pré-busca (acertos_prefetch + desperdicadas);
+    - lotes: leituras de pré-busca (cada uma com uma ou mais páginas).
+    As falhas por demanda ficam em politica.falhas. Páginas fora de 0 a max_paginas - 1 não são pré-buscadas."""
+    pendentes = set()  # Páginas pré-buscadas ainda não referenciadas
+    acertos_prefetch = desperdicadas = paginas_lidas = lotes = 0
+
+    for pagina in paginas:
+        falha = politica.acessar(pagina)
+        acerto_prefetch = False
+        if pendentes and pagina in pendentes:
+            pendentes.remove(pagina)
+            if falha:
+                desperdicadas += 1
+            else:
+                acertos_prefetch += 1
+                acerto_prefetch = True
+
+        lidas = 0
+        for candidata in prefetcher.observar(pagina, falha, acerto_prefetch):
+            if candidata < 0 or (max_paginas is not None and candidata >= max_paginas):
+                continue
+            if politica.carregar(candidata):
+                # Uma página pendente carregada de novo foi removida sem ser referenciada desde a carga anterior
+                if candidata in pendentes:
+                    desperdicadas += 1
+                else:
+                    pendentes.add(candidata)
+                lidas += 1
+        if lidas:
+            lotes += 1
+            paginas_lidas += lidas
+
+    return {
+        "acertos_prefetch": acertos_prefetch,
+        "desperdicadas": desperdicadas + len(pendentes),
+        "paginas_lidas": paginas_lidas,
+        "lotes": lotes,
+    }
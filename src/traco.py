@@ -0,0 +1,97 @@
+from array import array
+from collections import OrderedDict
+from itertools import groupby
+from operator import countOf
+
+
+class Traco:
+    """Sequência de acessos materializada em memória de forma compacta (array de inteiros sem sinal).
+    Pode ser passada no lugar de qualquer gerador de sequência: chamar o traço devolve um iterador sobre as páginas."""
+
+    def __init__(self, nome: str, paginas: array, semente: int | None = None) -> None:
+        self.__name__ = nome
+        self.paginas = paginas
+        self.semente = semente
+
+    def __call__(self):
+        return iter(self.paginas)
+
+    def __len__(self) -> int:
+        return len(self.paginas)
+
+    @classmethod
+    def materializar(cls, nome: str, gerador, max_pag_novas: int, semente: int | None = None) -> "Traco":
+        """Percorre o gerador uma única vez, guardando as páginas no menor tipo inteiro que as comporta."""
+        tipo = "I" if max_pag_novas <= 2**32 else "Q"
+        return cls(nome, array(tipo, gerador), semente)
+
+
+def compactar_repeticoes(paginas):
+    """Agrupa referências seguidas à mesma página em pares (página, repetições)."""
+    for pagina, grupo in groupby(paginas):
+        yield pagina, countOf(grupo, pagina)
+
+
+class TracoCompactado:
+    """Traço compactado em repetições: cada página guardada com o número de referências seguidas a ela.
+    Chamar o traço devolve um iterador sobre os pares (página, repetições), consumidos por
+    Politica.acessar_compactado; a compactação só reduz o trabalho em traços com muitas referências repetidas."""
+
+    def __init__(self, nome: str, paginas: array, repeticoes: array, semente: int | None = None) -> None:
+        self.__name__ = nome
+        self.paginas = paginas
+        self.repeticoes = repeticoes
+        self.semente = semente
+
+    def __call__(self):
+        return zip(self.paginas, self.repeticoes)
+
+    def __len__(self) -> int:
+        """Número de referências do traço expandido."""
+        return sum(self.repeticoes)
+
+    def expandir(self):
+        """Iterador sobre as páginas do traço original, uma por referência."""
+        for pagina, repeticoes in zip(self.paginas, self.repeticoes):
+            yield from (pagina,) * repeticoes
+
+    @classmethod
+    def compactar(cls, traco: Traco) -> "TracoCompactado":
+        paginas = array(traco.paginas.typecode)
+        repeticoes = array("I")
+        for pagina, quantidade in compactar_repeticoes(traco.paginas):
+            paginas.append(pagina)
+            repeticoes.append(quantidade)
+        return cls(traco.__name__, paginas, repeticoes, traco.semente)
+
+
+class CacheDeTracos:
+    """Cache de traços com remoção do usado menos recentemente (LRU).
+    A chave identifica o traço: (gerador, semente, número de acessos, máximo de páginas)."""
+
+    def __init__(self, max_tracos: int = 8) -> None:
+        self.max_tracos = max_tracos
+        self.__tracos = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__tracos)
+
+    def obter(self, chave: tuple, criar) -> Traco:
+        """Retorna o traço da chave, criando-o com criar() caso não esteja no cache."""
+        traco = self.__tracos.get(chave)
+        if traco is not None:
+            self.__tracos.move_to_end(chave)
+            return traco
+
+        traco = criar()
+        self.__tracos[chave] = traco
+        if len(self.__tracos) > self.max_tracos:
+            self.__tracos.popitem(last=False)
+        return traco
+
+    def limpar(self) -> None:
+        self.__tracos.clear()
+
+
+# Cache compartilhado por todos os alocadores
+cache_de_tracos = CacheDeTracos()
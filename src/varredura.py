@@ -0,0 +1,107 @@
+import hashlib
+import inspect
+import itertools
+import json
+import os
+import sqlite3
+
+import alocador_de_paginas
+import curvas
+import estruturas
+import politicas
+import traco
+from alocador_de_paginas import AlocadorDePaginas
+from executor import ALGORITMOS, tarefas_da_configuracao, executar_tarefa, executar_em_paralelo
+
+
+def versao_do_codigo() -> str:
+    """Identifica a versão dos módulos que determinam os resultados das simulações (hash do código fonte).
+    Qualquer alteração nesses módulos invalida os resultados guardados em cache."""
+    resumo = hashlib.sha256()
+    for modulo in (alocador_de_paginas, curvas, estruturas, politicas, traco):
+        with open(modulo.__file__, "rb") as arquivo:
+            resumo.update(arquivo.read())
+    return resumo.hexdigest()[:16]
+
+
+VERSAO_CODIGO = versao_do_codigo()
+
+
+def chave_da_tarefa(tarefa: dict) -> str:
+    """Monta a chave de cache de uma tarefa: (algoritmo, parâmetros, identidade do traço, versão do código)."""
+    semente_sequencia = inspect.signature(getattr(AlocadorDePaginas, tarefa["sequencia"])).parameters["semente"].default
+    chave = {
+        "algoritmo": tarefa["algoritmo"],
+        "parametros": [tarefa["num_quadros"], tarefa["tempo_memoria"], tarefa["tempo_tratamento"], tarefa["semente"]],
+        "traco": [tarefa["sequencia"], semente_sequencia, tarefa["num_acessos"], tarefa["max_pag_novas"]],
+        "versao": VERSAO_CODIGO,
+    }
+    return json.dumps(chave, sort_keys=True)
+
+
+class CacheDeResultados:
+    """Resultados de simulações guardados em disco (SQLite), indexados pela chave da tarefa."""
+
+    def __init__(self, caminho: str = "resultados.sqlite") -> None:
+        self.caminho = caminho
+        self.__conexao = sqlite3.connect(caminho)
+        with self.__conexao:
+            self.__conexao.execute(
+                "CREATE TABLE IF NOT EXISTS resultados (chave TEXT PRIMARY KEY, resultado TEXT NOT NULL)")
+
+    def obter(self, tarefa: dict) -> dict | None:
+        linha = self.__conexao.execute(
+            "SELECT resultado FROM resultados WHERE chave = ?", (chave_da_tarefa(tarefa),)).fetchone()
+        if linha is None:
+            return None
+        # O cenário é apenas um rótulo da varredura atual, não faz parte da chave
+        return {**json.loads(linha[0]), "cenario": tarefa["cenario"]}
+
+    def guardar(self, tarefa: dict, resultado: dict) -> None:
+        with self.__conexao:
+            self.__conexao.execute("INSERT OR REPLACE INTO resultados (chave, resultado) VALUES (?, ?)",
+                                   (chave_da_tarefa(tarefa), json.dumps(resultado)))
+
+    def __len__(self) -> int:
+        return self.__conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def fechar(self) -> None:
+        self.__conexao.close()
+
+
+def executar_com_cache(tarefas: list, cache: CacheDeResultados, processos: int = 1):
+    """Devolve o resultado de cada tarefa, na ordem das tarefas, simulando apenas as que não estão no cache.
+    Os resultados novos são guardados no cache à medida que ficam prontos."""
+    encontrados = [cache.obter(tarefa) for tarefa in tarefas]
+    faltantes = [tarefa for tarefa, resultado in zip(tarefas, encontrados) if resultado is None]
+
+    if processos == 1:
+        novos = map(executar_tarefa, faltantes)
+    else:
+        novos = executar_em_paralelo(faltantes, processos or None)
+
+    for tarefa, resultado in zip(tarefas, encontrados):
+        if resultado is None:
+            resultado = next(novos)
+            cache.guardar(tarefa, resultado)
+        yield resultado
+
+
+def varrer(quadros, paginas, acessos=(100_000,), sequencias=("sequencia_aleatoria",), algoritmos=ALGORITMOS,
+           caminho_cache: str = "resultados.sqlite", processos: int = 1, **parametros) -> list:
+    """Varre todas as combinações de número de quadros, páginas endereçáveis, número de acessos e sequências,
+    para cada algoritmo, devolvendo a lista de resultados. Pontos já simulados (em qualquer varredura anterior
+    com a mesma versão do código) vêm do cache em disco; só os pontos faltantes são simulados.
+    Parâmetros adicionais (tempo_memoria, tempo_tratamento, semente) valem para todos os pontos."""
+    cenarios = [
+        {**parametros, "num_quadros": q, "max_pag_novas": p, "num_acessos": a, "sequencia": s,
+         "algoritmos": list(algoritmos)}
+        for q, p, a, s in itertools.product(quadros, paginas, acessos, sequencias)
+    ]
+    tarefas = tarefas_da_configuracao(cenarios)
+
+    cache = CacheDeResultados(os.fspath(caminho_cache))
+    try:
+        return list(executar_com_cache(tarefas, cache, processos))
+    finally:
+        cache.fechar()
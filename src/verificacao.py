@@ -0,0 +1,71 @@
+import argparse
+import inspect
+import sys
+
+from alocador_de_paginas import AlocadorDePaginas
+from executor import nome_sequencia
+from politicas import POLITICAS
+from traco import compactar_repeticoes
+
+
+# VERIFICAÇÃO DAS POLÍTICAS INCREMENTAIS
+# Cada algoritmo existe como método de AlocadorDePaginas e como política incremental (politicas.POLITICAS), e as duas
+# formas devem produzir as mesmas falhas para a mesma sequência e semente. A verificação compara o método com a política
+# sobre os três geradores de sequência, também com janelas de taxa de falhas e, nas políticas que declaram
+# repeticoes_exatas, com o traço compactado em repetições. Termina com erro se alguma forma divergir.
+
+# (quadros, páginas endereçáveis) verificados por padrão, incluindo o caso de um único quadro
+CASOS_PADRAO = [(1, 8), (16, 24), (64, 128), (256, 1024)]
+SEQUENCIAS_PADRAO = ["sequencia_aleatoria", "sequencia_localizada", "sequencia_linear"]
+
+
+def verificar(casos=CASOS_PADRAO, sequencias=SEQUENCIAS_PADRAO, algoritmos=POLITICAS, acessos: int = 20_000,
+              janela: int = 997) -> tuple[int, list]:
+    """Compara as falhas do método e da política de cada algoritmo em cada caso e sequência.
+    Retorna (combinações verificadas, divergências); cada divergência é um dicionário com o caso e as falhas de cada forma."""
+    verificadas = 0
+    divergencias = []
+    for quadros, paginas in casos:
+        alocador = AlocadorDePaginas(quadros, paginas, num_acessos=acessos)
+        for sequencia in sequencias:
+            traco = alocador.traco(getattr(alocador, nome_sequencia(sequencia)))
+            for algoritmo in algoritmos:
+                classe = POLITICAS[algoritmo]
+                opcoes = {"semente": alocador.semente} if "semente" in inspect.signature(classe).parameters else {}
+
+                falhas = {"metodo": getattr(alocador, algoritmo)(traco)[0]["total"]}
+                politica = classe(quadros, **opcoes)
+                politica.acessar_lote(traco())
+                falhas["politica"] = politica.falhas
+                politica = classe(quadros, janela=janela, **opcoes)
+                politica.acessar_lote(traco())
+                falhas["janela"] = politica.falhas
+                if classe.repeticoes_exatas:
+                    politica = classe(quadros, **opcoes)
+                    politica.acessar_compactado(compactar_repeticoes(traco()))
+                    falhas["compactado"] = politica.falhas
+
+                verificadas += 1
+                if len(set(falhas.values())) > 1:
+                    divergencias.append({"algoritmo": algoritmo, "quadros": quadros, "paginas": paginas,
+                                         "sequencia": traco.__name__, **falhas})
+    return verificadas, divergencias
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Verifica se métodos e políticas incrementais produzem as mesmas falhas.")
+    parser.add_argument("--algoritmos", nargs="+", default=list(POLITICAS), choices=list(POLITICAS))
+    parser.add_argument("--sequencias", nargs="+", default=SEQUENCIAS_PADRAO, help="tipos de sequência")
+    parser.add_argument("--acessos", type=int, default=20_000, help="acessos por sequência")
+    args = parser.parse_args(argv)
+
+    verificadas, divergencias = verificar(sequencias=args.sequencias, algoritmos=args.algoritmos, acessos=args.acessos)
+    for divergencia in divergencias:
+        print(f"DIVERGÊNCIA {divergencia}")
+    if divergencias:
+        sys.exit(1)
+    print(f"{verificadas} combinações verificadas, sem divergências.")
+
+
+if __name__ == "__main__":
+    main()